@@ -19,6 +19,8 @@ import (
 	"os"
 	"os/signal"
 	"path/filepath"
+	"runtime/debug"
+	"strconv"
 	"strings"
 	"sync"
 	"syscall"
@@ -28,6 +30,7 @@ import (
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/bridge"
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/common"
 	pkgcontext "github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/context"
+	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/helical"
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/log"
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/tranquilspeak"
 )
@@ -37,8 +40,19 @@ var (
 	logger log.LoggerInterface
 	mainContext pkgcontext.ContextVector7D
 	bridgeClient *bridge.Bridge
+	bridgeMtx sync.Mutex
 	servers []*http.Server
 	serversMtx sync.Mutex
+
+	// wsUpgrader is shared by all /ws connections; the pool lets idle
+	// connections return their write buffers instead of pinning 1 KiB each
+	wsUpgrader = websocket.Upgrader{
+		ReadBufferSize:  1024,
+		WriteBufferSize: 1024,
+		WriteBufferPool: &sync.Pool{},
+		CheckOrigin:     func(r *http.Request) bool { return true },
+		// EnableCompression is set from Config.WSCompression at startup
+	}
 )
 
 type Config struct {
@@ -50,10 +64,34 @@ type Config struct {
 	BridgeEnabled bool
 	BridgePort int
 	FormulaRegistryPath string
+	MaxHandshakes int
+	WSCompression bool
 }
 
 func main() {
 	var err error
+	// Log records are written asynchronously; flush them on every return or
+	// panic out of main (os.Exit paths flush explicitly)
+	defer log.Flush()
+
+	// 0. Parse flags before any heavy initialization so -h and flag errors
+	// exit immediately without loading the symbol or formula registries
+	config := loadConfig()
+
+	// Register shutdown signals once, up front; rootCtx is cancelled on
+	// shutdown so everything derived from it (bridge client) stops with us
+	quit := make(chan os.Signal, 1)
+	signal.Notify(quit, syscall.SIGINT, syscall.SIGTERM)
+	rootCtx, cancelRoot := context.WithCancel(context.Background())
+	defer cancelRoot()
+
+	// 1+2. The symbol and formula registries are independent files: read the
+	// formula registry in the background while the symbol registry loads, so
+	// startup waits for the slower of the two rather than both in turn
+	formulaErr := make(chan error, 1)
+	go func() {
+		formulaErr <- bridge.LoadBridgeFormulaRegistry(config.FormulaRegistryPath)
+	}()
 
 	// 1. Load Symbol Registry (TranquilSpeak, event/trigger definitions)
 	err = tranquilspeak.LoadSymbolRegistry("/Users/Jubicudis/Tranquility-Neuro-OS/systems/tranquilspeak/circulatory/github-mcp-server/symbolic_mapping_registry_autogen_20250603.tsq")
@@ -61,13 +99,8 @@ func main() {
 		panic("[FATAL] Could not load TranquilSpeak symbol registry: " + err.Error())
 	}
 
-	// 2. Load Formula Registry (Mobius, HemoFlux, etc.)
-	config := loadConfig()
-	formulaPath := config.FormulaRegistryPath
-	if formulaPath == "" {
-		formulaPath = filepath.Join("config", "formulas.json")
-	}
-	if err := bridge.LoadBridgeFormulaRegistry(formulaPath); err != nil {
+	// 2. Formula Registry (Mobius, HemoFlux, etc.), loaded concurrently above
+	if err := <-formulaErr; err != nil {
 		fmt.Fprintf(os.Stderr, "Failed to load formula registry: %v\n", err)
 	}
 
@@ -82,16 +115,19 @@ func main() {
 		Extent: 1.0,
 		Source: "github_mcp",
 	}
+	// Render the startup context once; every startup event and the bridge share it read-only
+	mainContextMap := log.ToMap(mainContext)
 
 	// 4. Configure Canonical Logging and Event Routing (TriggerMatrix, logger)
 	triggerMatrix := tranquilspeak.NewTriggerMatrix()
 	logger = initLogger(config, triggerMatrix)
 	logger.Info("[BOOT] GitHub MCP Server starting up (7D/ATM/AI-DNA/TranquilSpeak)")
+	warnSlowBuild()
 
 	// 5. Register All Canonical Tools and Bridges (Context orchestrator, event triggers)
 	orchestrator := pkgcontext.NewContextOrchestrator(logger)
 	logger.Info("Context orchestrator initialized (ATM/7D/biomimetic)")
-	registerATMEventTriggers(orchestrator)
+	registerATMEventTriggers(orchestrator, mainContextMap)
 
 	// 6. Initialize Port Assignment AI (Mobius Collapse, formula registry-driven)
 	// (If there is a Mobius/port assignment module, initialize it here. Otherwise, ensure formula registry is loaded.)
@@ -110,7 +146,7 @@ func main() {
 		bridgeOpts := common.ConnectionOptions{
 			ServerURL:   fmt.Sprintf("ws://%s:%d/bridge", config.Host, config.BridgePort),
 			ServerPort:  config.BridgePort,
-			Context:     log.ToMap(mainContext),
+			Context:     mainContextMap,
 			Logger:      logger,
 			Timeout:     60 * time.Second,
 			MaxRetries:  5,
@@ -118,34 +154,77 @@ func main() {
 			Credentials: map[string]string{"source": "github-mcp-server"},
 			Headers:     map[string]string{"X-QHP-Version": "1.0"},
 		}
-		ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
-		defer cancel()
-		bridgeClient, err = bridge.NewClient(ctx, bridgeOpts, triggerMatrix)
-		if err != nil {
-			logger.Error("Failed to connect to MCP bridge: %v", err)
-		} else {
-			logger.Info("MCP bridge client connected to TNOS MCP server")
-			// Optionally send a status message
-			statusMsg := common.Message{
-				Type:      "status",
-				Timestamp: time.Now().Unix(),
-				Payload: map[string]interface{}{
-					"event":   "startup",
-					"context": log.ToMap(mainContext),
-					"message": "GitHub MCP Server startup complete. Bridge client active.",
-				},
-			}
-			err := bridgeClient.Send(statusMsg)
+		// Connect in the background so startup retries never delay signal
+		// handling; the client lives until shutdown cancels rootCtx
+		go func() {
+			client, err := connectBridge(rootCtx, bridgeOpts, triggerMatrix)
 			if err != nil {
-				logger.Warn("Failed to send bridge status message: %v", err)
+				logger.Error("Failed to connect to MCP bridge: %v", err)
 			} else {
-				logger.Info("Bridge status message sent to MCP bridge.")
+				// Publish the client under bridgeMtx; if shutdown already cancelled
+				// rootCtx it has closed whatever it saw, so close this one here
+				bridgeMtx.Lock()
+				if rootCtx.Err() != nil {
+					bridgeMtx.Unlock()
+					client.Close()
+					return
+				}
+				bridgeClient = client
+				bridgeMtx.Unlock()
+				logger.Info("MCP bridge client connected to TNOS MCP server")
+				// Optionally send a status message
+				statusMsg := common.Message{
+					Type:      "status",
+					Timestamp: time.Now().Unix(),
+					Payload: map[string]interface{}{
+						"event":   "startup",
+						"context": mainContextMap,
+						"message": "GitHub MCP Server startup complete. Bridge client active.",
+					},
+				}
+				err := client.Send(statusMsg)
+				if err != nil {
+					logger.Warn("Failed to send bridge status message: %v", err)
+				} else {
+					logger.Info("Bridge status message sent to MCP bridge.")
+				}
 			}
-		}
+		}()
 	}
 
 	// 9. Wait for shutdown signal
-	waitForShutdown()
+	waitForShutdown(quit, cancelRoot)
+}
+
+// maxBridgeRetryDelay caps the doubling retry delay in connectBridge
+const maxBridgeRetryDelay = 30 * time.Second
+
+// connectBridge creates the bridge client, retrying failed attempts with exponential
+// backoff (RetryDelay doubling up to maxBridgeRetryDelay, up to MaxRetries attempts)
+// so a TNOS MCP server that is still starting does not force a restart of this process
+func connectBridge(ctx context.Context, opts common.ConnectionOptions, triggerMatrix *tranquilspeak.TriggerMatrix) (*bridge.Bridge, error) {
+	delay := opts.RetryDelay
+	for attempt := 1; ; attempt++ {
+		// Each dial is bounded by opts.Timeout
+		client, err := bridge.NewClient(ctx, opts, triggerMatrix)
+		if err == nil {
+			return client, nil
+		}
+		if attempt >= opts.MaxRetries {
+			return nil, err
+		}
+		logger.Warn("Bridge connection attempt %d/%d failed: %v (retrying in %v)", attempt, opts.MaxRetries, err, delay)
+		wait := time.NewTimer(delay)
+		select {
+		case <-ctx.Done():
+			wait.Stop()
+			return nil, err
+		case <-wait.C:
+		}
+		if delay *= 2; delay > maxBridgeRetryDelay {
+			delay = maxBridgeRetryDelay
+		}
+	}
 }
 
 func loadConfig() Config {
@@ -157,8 +236,19 @@ func loadConfig() Config {
 	flag.StringVar(&config.GitHubToken, "token", os.Getenv("GITHUB_TOKEN"), "GitHub token")
 	flag.BoolVar(&config.BridgeEnabled, "bridge", false, "Enable MCP bridge (disabled by default)")
 	flag.IntVar(&config.BridgePort, "bridgeport", 10619, "Bridge port")
-	flag.StringVar(&config.FormulaRegistryPath, "formulas", "", "Formula registry path")
+	flag.StringVar(&config.FormulaRegistryPath, "formulas", filepath.Join("config", "formulas.json"), "Formula registry path")
+	maxHandshakes, _ := strconv.Atoi(os.Getenv("MCP_WS_MAX_CONCURRENT_HANDSHAKES"))
+	flag.IntVar(&config.MaxHandshakes, "maxhandshakes", maxHandshakes, "Max concurrent /ws QHP handshakes (0 = unlimited)")
+	flag.BoolVar(&config.WSCompression, "wscompression", false, "Accept permessage-deflate on /ws when clients offer it")
 	flag.Parse()
+	// Reject stray positional arguments (e.g. "bridge" instead of "-bridge")
+	// here, before main reads registries from disk or binds any ports
+	if flag.NArg() > 0 {
+		fmt.Fprintf(os.Stderr, "unexpected arguments: %s\n", strings.Join(flag.Args(), " "))
+		flag.Usage()
+		log.Flush()
+		os.Exit(2)
+	}
 	return config
 }
 
@@ -177,55 +267,123 @@ func initLogger(config Config, triggerMatrix *tranquilspeak.TriggerMatrix) log.L
 	return logger
 }
 
-func registerATMEventTriggers(orchestrator *pkgcontext.ContextOrchestrator) {
+// warnSlowBuild warns when the binary was built in a mode that slows every hot
+// path (race detector or disabled optimizations), so a debug build is not
+// mistaken for production performance
+func warnSlowBuild() {
+	info, ok := debug.ReadBuildInfo()
+	if !ok {
+		return
+	}
+	for _, setting := range info.Settings {
+		switch {
+		case setting.Key == "-race" && setting.Value == "true":
+			logger.Warn("[BOOT] Built with -race; expect several times slower bridge and ATM paths")
+		case setting.Key == "-gcflags" && strings.Contains(setting.Value, "-N"):
+			logger.Warn("[BOOT] Built with optimizations disabled (-gcflags %s); rebuild without -N -l for production", setting.Value)
+		}
+	}
+}
+
+func registerATMEventTriggers(orchestrator *pkgcontext.ContextOrchestrator, contextMap map[string]interface{}) {
+	// All three events describe the same registration moment; sample the clock once
+	now := time.Now().Unix()
 	// Startup event
 	orchestrator.ProcessContext("startup", map[string]interface{}{
 		"event": "startup",
-		"timestamp": time.Now().Unix(),
-		"context": log.ToMap(mainContext),
+		"timestamp": now,
+		"context": contextMap,
 	})
 	// Shutdown event
 	orchestrator.ProcessContext("shutdown", map[string]interface{}{
 		"event": "shutdown",
-		"timestamp": time.Now().Unix(),
-		"context": log.ToMap(mainContext),
+		"timestamp": now,
+		"context": contextMap,
 	})
 	// API event example
 	orchestrator.ProcessContext("api_event", map[string]interface{}{
 		"event": "api_event",
-		"timestamp": time.Now().Unix(),
-		"context": log.ToMap(mainContext),
+		"timestamp": now,
+		"context": contextMap,
 	})
 }
 
+// Fixed response bodies for the status endpoints, converted once rather than per request
+var (
+	healthOKBody  = []byte("OK")
+	apiStatusBody = []byte("GitHub MCP API is running")
+)
+
+// acceptQHPHandshake issues a session key for fingerprint, records the peer in the
+// trust table and builds the ack; the /ws and /qhp handshakes share it
+func acceptQHPHandshake(trustTable *bridge.TrustTable, fingerprint, remoteAddr string) bridge.QHPHandshakeAck {
+	sessionKey := bridge.GenerateQuantumFingerprint(fingerprint + "-session")
+	trustTable.Update(fingerprint, sessionKey, map[string]interface{}{"remote_addr": remoteAddr})
+	return bridge.QHPHandshakeAck{
+		Type:        "qhp_handshake_ack",
+		Fingerprint: fingerprint,
+		SessionKey:  sessionKey,
+		TrustTable:  trustTable.All(),
+	}
+}
+
 func startGitHubMCPServer(config Config, orchestrator *pkgcontext.ContextOrchestrator) {
+	// Optional cap on concurrent /ws handshakes so connection bursts queue
+	// instead of timing out; a slot is held only until the QHP ack is sent
+	var handshakeSem chan struct{}
+	if config.MaxHandshakes > 0 {
+		handshakeSem = make(chan struct{}, config.MaxHandshakes)
+	}
+
+	// /ws frames carry no application-level compression; permessage-deflate
+	// costs CPU and allocations per frame, so it is opt-in for large payloads
+	wsUpgrader.EnableCompression = config.WSCompression
+
+	// Resolve the process-wide trust table once; both handshake handlers use it
+	trustTable := bridge.GetTrustTable()
+
 	mux := http.NewServeMux()
 	mux.HandleFunc("/health", func(w http.ResponseWriter, r *http.Request) {
 		w.WriteHeader(http.StatusOK)
-		w.Write([]byte("OK"))
+		w.Write(healthOKBody)
 	})
 	// Canonical GitHub MCP API endpoints
 	mux.HandleFunc("/api/github", func(w http.ResponseWriter, r *http.Request) {
 		w.WriteHeader(http.StatusOK)
-		w.Write([]byte("GitHub MCP API is running"))
+		w.Write(apiStatusBody)
 	})
 	// Canonical WebSocket endpoint (for event-driven, ATM-compliant ops)
 	mux.HandleFunc("/ws", func(w http.ResponseWriter, r *http.Request) {
-		// Use gorilla/websocket Upgrader directly (no GetCanonicalUpgrader)
-		upgrader := websocket.Upgrader{
-			ReadBufferSize:  1024,
-			WriteBufferSize: 1024,
-			CheckOrigin: func(r *http.Request) bool { return true },
+		if handshakeSem != nil {
+			select {
+			case handshakeSem <- struct{}{}:
+			case <-r.Context().Done():
+				return
+			}
+		}
+		handshakeDone := false
+		releaseHandshake := func() {
+			if handshakeSem != nil && !handshakeDone {
+				handshakeDone = true
+				<-handshakeSem
+			}
 		}
-		conn, err := upgrader.Upgrade(w, r, nil)
+		defer releaseHandshake()
+
+		// Use gorilla/websocket Upgrader directly (no GetCanonicalUpgrader)
+		conn, err := wsUpgrader.Upgrade(w, r, nil)
 		if err != nil {
 			logger.Error("WebSocket upgrade failed: %v", err)
 			return
 		}
 		defer conn.Close()
+		if handshakeSem != nil {
+			// A stalled client must not hold a handshake slot indefinitely
+			_ = conn.SetReadDeadline(time.Now().Add(common.ReadTimeout))
+		}
 
 		// QHP handshake phase
-		var handshakeMsg map[string]interface{}
+		var handshakeMsg bridge.QHPHandshake
 		_, handshakeData, err := conn.ReadMessage()
 		if err != nil {
 			logger.Error("QHP handshake read error: %v", err)
@@ -235,28 +393,22 @@ func startGitHubMCPServer(config Config, orchestrator *pkgcontext.ContextOrchest
 			logger.Error("QHP handshake unmarshal error: %v", err)
 			return
 		}
-		if handshakeMsg["type"] != "qhp_handshake" {
+		if handshakeMsg.Type != "qhp_handshake" {
 			logger.Error("QHP handshake: invalid type")
 			return
 		}
-		fingerprint, _ := handshakeMsg["fingerprint"].(string)
 		// Optionally: verify developer override token here
-		// Accept handshake, generate session key
-		sessionKey := bridge.GenerateQuantumFingerprint(fingerprint + "-session")
-		// Update trust table
-		bridge.GetTrustTable().Update(fingerprint, sessionKey, map[string]interface{}{"remote_addr": r.RemoteAddr})
-		ack := map[string]interface{}{
-			"type":        "qhp_handshake_ack",
-			"fingerprint": fingerprint,
-			"session_key": sessionKey,
-			"trust_table": bridge.GetTrustTable().All(),
-		}
+		ack := acceptQHPHandshake(trustTable, handshakeMsg.Fingerprint, r.RemoteAddr)
 		ackData, _ := json.Marshal(ack)
 		if err := conn.WriteMessage(1, ackData); err != nil {
 			logger.Error("QHP handshake ack write error: %v", err)
 			return
 		}
-		logger.Info("QHP handshake complete", "fingerprint", fingerprint, "session_key", sessionKey)
+		logger.Info("QHP handshake complete: fingerprint=%s session_key=%s", ack.Fingerprint, ack.SessionKey)
+		if handshakeSem != nil {
+			_ = conn.SetReadDeadline(time.Time{})
+		}
+		releaseHandshake()
 
 		// Event-driven, ATM-compliant message loop
 		for {
@@ -265,21 +417,25 @@ func startGitHubMCPServer(config Config, orchestrator *pkgcontext.ContextOrchest
 				logger.Error("WebSocket read error: %v", err)
 				break
 			}
+			// Echo back for now (extend with event-driven logic). The echo does
+			// not depend on ATM processing, so it is written first and the
+			// client's round trip no longer waits for the trigger pipeline. A
+			// failed echo means the connection is gone, so stop before processing
+			if err := conn.WriteMessage(mt, message); err != nil {
+				logger.Error("WebSocket write error: %v", err)
+				return
+			}
 			var payload map[string]interface{}
 			_ = json.Unmarshal(message, &payload)
-			atmTrigger := tranquilspeak.CreateTrigger(
-				"WebSocketClient", "WebSocketMessage", "Layer6", "ClientEvent", "WebSocket", "1.0", tranquilspeak.TriggerTypeDataTransport, "context", payload,
-			)
-			_ = atmTrigger // prevent unused variable warning
+			// The orchestrator builds its own trigger from the payload; no
+			// per-message ATMTrigger is constructed here
 			err = orchestrator.ProcessContext("websocket_message", payload)
 			if err != nil {
 				logger.Error("ATM trigger processing failed: %v", err)
 			}
-			logger.Info("ATM trigger fired for WebSocket message", "payload", payload)
-			// Echo back for now (extend with event-driven logic)
-			if err := conn.WriteMessage(mt, message); err != nil {
-				logger.Error("WebSocket write error: %v", err)
-				break
+			// Rendering the payload map is the costly part; skip it when Info is filtered
+			if log.Enabled(logger, log.LevelInfo) {
+				logger.Info("ATM trigger fired for WebSocket message: payload=%v", payload)
 			}
 		}
 	})
@@ -291,36 +447,28 @@ func startGitHubMCPServer(config Config, orchestrator *pkgcontext.ContextOrchest
 			w.Write([]byte("POST required"))
 			return
 		}
-		var req map[string]interface{}
+		var req bridge.QHPHandshake
 		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
 			w.WriteHeader(http.StatusBadRequest)
 			w.Write([]byte("Invalid JSON"))
 			return
 		}
-		fingerprint, _ := req["fingerprint"].(string)
-		if fingerprint == "" {
+		if req.Fingerprint == "" {
 			w.WriteHeader(http.StatusBadRequest)
 			w.Write([]byte("Missing fingerprint"))
 			return
 		}
-		sessionKey := bridge.GenerateQuantumFingerprint(fingerprint + "-session")
-		bridge.GetTrustTable().Update(fingerprint, sessionKey, map[string]interface{}{"remote_addr": r.RemoteAddr})
-		resp := map[string]interface{}{
-			"type":        "qhp_handshake_ack",
-			"fingerprint": fingerprint,
-			"session_key": sessionKey,
-			"trust_table": bridge.GetTrustTable().All(),
-		}
+		resp := acceptQHPHandshake(trustTable, req.Fingerprint, r.RemoteAddr)
 		w.Header().Set("Content-Type", "application/json")
 		json.NewEncoder(w).Encode(resp)
-		logger.Info("QHP HTTP handshake complete", "fingerprint", fingerprint, "session_key", sessionKey)
+		logger.Info("QHP HTTP handshake complete: fingerprint=%s session_key=%s", resp.Fingerprint, resp.SessionKey)
 	})
 
 	addr := fmt.Sprintf("%s:%d", config.Host, config.Port)
 	server := &http.Server{Addr: addr, Handler: mux}
 	addServer(server)
 	go func() {
-		logger.Info("GitHub MCP Server listening", "address", addr)
+		logger.Info("GitHub MCP Server listening on %s", addr)
 		if err := server.ListenAndServe(); err != nil && err != http.ErrServerClosed {
 			logger.Error("Server ListenAndServe failed: %v", err)
 		}
@@ -333,41 +481,81 @@ func addServer(server *http.Server) {
 	serversMtx.Unlock()
 }
 
-func waitForShutdown() {
-	quit := make(chan os.Signal, 1)
-	signal.Notify(quit, syscall.SIGINT, syscall.SIGTERM)
+func waitForShutdown(quit chan os.Signal, cancelRoot context.CancelFunc) {
 	sig := <-quit
-	logger.Info("Received shutdown signal", "signal", sig.String())
+	// Hand signals back to the default handlers so a second Ctrl-C
+	// terminates immediately instead of queueing behind the graceful shutdown
+	signal.Stop(quit)
+	logger.Info("Received shutdown signal: %v", sig)
+	cancelRoot()
+	// Single shutdown path for the bridge client; Close is idempotent
+	bridgeMtx.Lock()
+	if bridgeClient != nil {
+		bridgeClient.Close()
+	}
+	bridgeMtx.Unlock()
 	updateSelfDocumentation("shutdown", "Server shutdown initiated.")
 	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
 	defer cancel()
+	// Drain every server concurrently so the grace period is bounded by the
+	// slowest server rather than the sum of all of them
 	serversMtx.Lock()
+	var shutdownWG sync.WaitGroup
 	for _, srv := range servers {
-		_ = srv.Shutdown(ctx)
+		shutdownWG.Add(1)
+		go func(srv *http.Server) {
+			defer shutdownWG.Done()
+			_ = srv.Shutdown(ctx)
+		}(srv)
 	}
+	shutdownWG.Wait()
 	serversMtx.Unlock()
+	// Servers are drained, so no more strands arrive; write the queued ones
+	// before the log sink is flushed for the last time
+	if err := helical.CloseGlobalHelicalEngine(); err != nil {
+		logger.Error("Failed to close helical memory engine: %v", err)
+	}
 	logger.Info("Shutdown complete (7D/ATM/AI-DNA/TranquilSpeak)")
 	updateSelfDocumentation("shutdown", "Server shutdown complete.")
+	log.Flush()
 }
 
+// Self-documentation targets, relative to the server's working directory
+const (
+	selfDocLogPath  = "../docs/development/REBUILD_TECHNICAL_LOG.md"
+	selfDocTodoPath = "../docs/TODO.md"
+)
+
 // Self-documenting logic for technical log and TODOs
+// Entries are a few dozen bytes, so they are assembled directly and written
+// with one Write per file rather than formatted through fmt
 func updateSelfDocumentation(event, message string) {
-	docPath := "../docs/development/REBUILD_TECHNICAL_LOG.md"
-	todoPath := "../docs/TODO.md"
 	timestamp := time.Now().Format(time.RFC3339)
-	entry := fmt.Sprintf("[%s] EVENT: %s\nDETAIL: %s\n", timestamp, event, message)
 	// Append to technical log
-	f, err := os.OpenFile(docPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	f, err := os.OpenFile(selfDocLogPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
 	if err == nil {
-		f.WriteString(entry)
+		entry := make([]byte, 0, len(timestamp)+len(event)+len(message)+24)
+		entry = append(entry, '[')
+		entry = append(entry, timestamp...)
+		entry = append(entry, "] EVENT: "...)
+		entry = append(entry, event...)
+		entry = append(entry, "\nDETAIL: "...)
+		entry = append(entry, message...)
+		entry = append(entry, '\n')
+		f.Write(entry)
 		f.Close()
 	}
 	// Optionally, update TODOs for major events
 	if event == "startup" || event == "shutdown" {
-		todoEntry := fmt.Sprintf("- [%s] %s\n", timestamp, message)
-		tf, err := os.OpenFile(todoPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+		tf, err := os.OpenFile(selfDocTodoPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
 		if err == nil {
-			tf.WriteString(todoEntry)
+			todoEntry := make([]byte, 0, len(timestamp)+len(message)+6)
+			todoEntry = append(todoEntry, "- ["...)
+			todoEntry = append(todoEntry, timestamp...)
+			todoEntry = append(todoEntry, "] "...)
+			todoEntry = append(todoEntry, message...)
+			todoEntry = append(todoEntry, '\n')
+			tf.Write(todoEntry)
 			tf.Close()
 		}
 	}
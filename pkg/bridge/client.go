@@ -12,9 +12,11 @@
 package bridge
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
+	"net"
 	"net/http"
 	"net/url"
 	"sync"
@@ -34,8 +36,8 @@ type Bridge struct {
 	conn       *websocket.Conn
 	options    common.ConnectionOptions
 	state      common.ConnectionState
-	mutex      sync.RWMutex
-	mu         sync.Mutex
+	mu         sync.Mutex  // guards conn, connected and stats
+	writeMu    sync.Mutex  // serializes socket writes (one concurrent writer)
 	stats      common.BridgeStats
 	ctx        context.Context
 	cancelFunc context.CancelFunc
@@ -43,7 +45,24 @@ type Bridge struct {
 	messages   chan common.Message
 	connected  bool        // Flag to track connection status
 	sessionKey string      // Session key from handshake
+	fingerprint string     // QHP identity, resolved once so reconnects reuse it
 	triggerMatrix *tranquilspeak.TriggerMatrix // Add triggerMatrix field
+	dialer     *websocket.Dialer // reused for every (re)connect
+	headers    http.Header       // handshake headers, built once from options
+}
+
+// defaultClientContext is the 7D context for clients created without one. It is
+// built once and shared read-only (messages only reference it), so reconnect
+// retries through NewClient do not rebuild it; "when" is the process start
+var defaultClientContext = map[string]interface{}{
+	"who":    "BridgeClient",
+	"what":   "Connection",
+	"when":   time.Now().Unix(),
+	"where":  "SystemLayer6",
+	"why":    "Communication",
+	"how":    "WebSocket",
+	"extent": 1.0,
+	"source": "GitHubMCPServer",
 }
 
 // NewClient creates a new bridge client with the given options and triggerMatrix
@@ -68,17 +87,7 @@ func NewClient(ctx context.Context, options common.ConnectionOptions, triggerMat
 
 	// Ensure context is initialized
 	if options.Context == nil {
-		// Create a default context
-		options.Context = map[string]interface{}{
-			"who":    "BridgeClient",
-			"what":   "Connection",
-			"when":   time.Now().Unix(),
-			"where":  "SystemLayer6",
-			"why":    "Communication",
-			"how":    "WebSocket",
-			"extent": 1.0,
-			"source": "GitHubMCPServer",
-		}
+		options.Context = defaultClientContext
 	}
 
 	client := &Bridge{
@@ -90,6 +99,22 @@ func NewClient(ctx context.Context, options common.ConnectionOptions, triggerMat
 		stats:      common.BridgeStats{},
 		state:      common.StateDisconnected,
 		triggerMatrix: triggerMatrix, // Store triggerMatrix in the client
+		dialer: &websocket.Dialer{
+			HandshakeTimeout: WriteTimeout,
+			// Offer permessage-deflate only when payloads are not already
+			// Möbius-compressed at the application layer
+			EnableCompression: !options.CompressionEnabled,
+		},
+		headers: http.Header{},
+	}
+	// Resolve the QHP fingerprint once: a configured credential wins, otherwise
+	// one is generated for this client and presented on every (re)connect
+	client.fingerprint = options.Credentials["fingerprint"]
+	if client.fingerprint == "" {
+		client.fingerprint = GenerateQuantumFingerprint("tnos-mcp") // Use node/system id as seed
+	}
+	for k, v := range options.Headers {
+		client.headers.Add(k, v)
 	}
 
 	err := client.connect()
@@ -98,7 +123,7 @@ func NewClient(ctx context.Context, options common.ConnectionOptions, triggerMat
 		return nil, fmt.Errorf("failed to connect to bridge: %w", err)
 	}
 
-	go client.readPump()
+	go client.readPump(client.conn)
 
 	return client, nil
 }
@@ -147,97 +172,86 @@ func (c *Bridge) connect() error {
 	return nil
 }
 
+// qhpHandshakeTimeout bounds the whole QHP exchange, send and ack read together
+const qhpHandshakeTimeout = 5 * time.Second
+
 // Helper for QHP handshake (shared for all fallback routes)
+// One deadline covers both the handshake write and the ack read, so a peer that
+// stalls at either step cannot hold the connect path open past qhpHandshakeTimeout
 func (c *Bridge) performQHPHandshake(conn *websocket.Conn) error {
-	fingerprint := ""
-	if c.options.Credentials != nil {
-		if val, ok := c.options.Credentials["fingerprint"]; ok {
-			fingerprint = val
-		}
-	}
-	if fingerprint == "" {
-		fingerprint = GenerateQuantumFingerprint("tnos-mcp") // Use node/system id as seed
-	}
-	handshakeMsg := map[string]interface{}{
-		"type":        "qhp_handshake",
-		"fingerprint": fingerprint,
-		"timestamp":   time.Now().Unix(),
+	handshakeMsg := QHPHandshake{
+		Type:        "qhp_handshake",
+		Fingerprint: c.fingerprint,
+		Timestamp:   time.Now().Unix(),
 	}
 	if c.options.Credentials != nil {
-		if val, ok := c.options.Credentials["developer_override_token"]; ok && val != "" {
-			handshakeMsg["override_token"] = val
-		}
+		handshakeMsg.OverrideToken = c.options.Credentials["developer_override_token"]
 	}
 	handshakeData, err := json.Marshal(handshakeMsg)
 	if err != nil {
 		return fmt.Errorf("failed to marshal QHP handshake: %w", err)
 	}
+	deadline := time.Now().Add(qhpHandshakeTimeout)
+	if err := conn.SetWriteDeadline(deadline); err != nil {
+		return fmt.Errorf("failed to set QHP handshake deadline: %w", err)
+	}
+	if err := conn.SetReadDeadline(deadline); err != nil {
+		return fmt.Errorf("failed to set QHP handshake deadline: %w", err)
+	}
 	err = conn.WriteMessage(websocket.TextMessage, handshakeData)
 	if err != nil {
 		return fmt.Errorf("failed to send QHP handshake: %w", err)
 	}
-	ackCh := make(chan error, 1)
-	go func() {
-		type handshakeAck struct {
-			Type        string      `json:"type"`
-			Fingerprint string      `json:"fingerprint"`
-			TrustTable  interface{} `json:"trust_table"`
-			SessionKey  string      `json:"session_key"`
-		}
-		_, data, err := conn.ReadMessage()
-		if err != nil {
-			ackCh <- fmt.Errorf("failed to read QHP handshake ack: %w", err)
-			return
-		}
-		var ack handshakeAck
-		err = json.Unmarshal(data, &ack)
-		if err != nil {
-			ackCh <- fmt.Errorf("invalid QHP handshake ack: %w", err)
-			return
-		}
-		if ack.Type != "qhp_handshake_ack" {
-			ackCh <- fmt.Errorf("unexpected handshake response type: %s", ack.Type)
-			return
-		}
-		c.sessionKey = ack.SessionKey
-		ackCh <- nil
-	}()
-	select {
-	case err := <-ackCh:
-		if err != nil {
-			return err
+	// Only the fields the client uses; the decoder skips trust_table
+	// rather than building a generic map for it
+	type handshakeAck struct {
+		Type       string `json:"type"`
+		SessionKey string `json:"session_key"`
+	}
+	_, data, err := conn.ReadMessage()
+	if err != nil {
+		if netErr, ok := err.(net.Error); ok && netErr.Timeout() {
+			return fmt.Errorf("QHP handshake timed out")
 		}
-	case <-time.After(5 * time.Second):
-		return fmt.Errorf("QHP handshake timed out")
+		return fmt.Errorf("failed to read QHP handshake ack: %w", err)
+	}
+	var ack handshakeAck
+	err = json.Unmarshal(data, &ack)
+	if err != nil {
+		return fmt.Errorf("invalid QHP handshake ack: %w", err)
 	}
+	if ack.Type != "qhp_handshake_ack" {
+		return fmt.Errorf("unexpected handshake response type: %s", ack.Type)
+	}
+	c.sessionKey = ack.SessionKey
+	// Clear the handshake deadline; readPump and writeFrame set their own
+	_ = conn.SetWriteDeadline(time.Time{})
+	_ = conn.SetReadDeadline(time.Time{})
 	return nil
 }
 
 // tryConnect attempts a WebSocket connection to the given URL and updates the client state
+// The dial and handshake run without holding mu; the new connection is then
+// published only if no other attempt won the race, so mu is the single lock
+// for connection state instead of a second mutex guarding the same fields.
 func (c *Bridge) tryConnect(serverURL string) (interface{}, error) {
-	c.mutex.Lock()
-	defer c.mutex.Unlock()
-	if c.connected && c.conn != nil {
+	c.mu.Lock()
+	alreadyConnected := c.connected && c.conn != nil
+	c.mu.Unlock()
+	if alreadyConnected {
 		return nil, nil
 	}
 	u, err := url.Parse(serverURL)
 	if err != nil {
 		return nil, fmt.Errorf("invalid bridge URL: %w", err)
 	}
-	headers := http.Header{}
-	for k, v := range c.options.Headers {
-		headers.Add(k, v)
-	}
-	dialer := websocket.Dialer{
-		HandshakeTimeout: WriteTimeout,
-	}
 	dialCtx := c.ctx
 	if c.options.Timeout > 0 {
 		var cancel context.CancelFunc
 		dialCtx, cancel = context.WithTimeout(c.ctx, c.options.Timeout)
 		defer cancel()
 	}
-	conn, resp, err := dialer.DialContext(dialCtx, u.String(), headers)
+	conn, resp, err := c.dialer.DialContext(dialCtx, u.String(), c.headers)
 	if err != nil {
 		statusCode := 0
 		if resp != nil {
@@ -251,9 +265,17 @@ func (c *Bridge) tryConnect(serverURL string) (interface{}, error) {
 		conn.Close()
 		return nil, err
 	}
+	c.mu.Lock()
+	if c.connected && c.conn != nil {
+		// A concurrent attempt connected first; keep its connection
+		c.mu.Unlock()
+		conn.Close()
+		return nil, nil
+	}
 	c.conn = conn
 	c.connected = true
 	c.stats.LastActive = time.Now()
+	c.mu.Unlock()
 	return nil, nil
 }
 
@@ -288,44 +310,101 @@ func (c *Bridge) Send(msg common.Message) error {
 	// HOW: Using FallbackRoute and FormulaRegistry
 	// EXTENT: All message sends
 
-	fallbackSend := func() (interface{}, error) {
-		c.mu.Lock()
-		defer c.mu.Unlock()
-		if !c.connected || c.conn == nil {
-			return nil, ErrBridgeNotConnected
-		}
-		if msg.Context == nil && c.options.Context != nil {
-			// Check if who key exists in the context map
-			if _, ok := c.options.Context["who"]; ok {
-				msg.Context = c.options.Context
-			}
-		}
-		// Compression logic can be added here if needed, using shared utilities
-		data, err := json.Marshal(msg)
-		if err != nil {
-			return nil, fmt.Errorf("failed to marshal message: %w", err)
+	c.applyDefaultContext(&msg)
+	// Encode before taking the connection lock so concurrent senders only
+	// serialize on the socket write itself
+	// Compression logic can be added here if needed, using shared utilities
+	buf, err := encodeFrame(msg)
+	if err != nil {
+		return fmt.Errorf("failed to marshal message: %w", err)
+	}
+	defer releaseFrame(buf)
+	return c.writeFrame(frameBytes(buf))
+}
+
+// framePool recycles frame encoding buffers; WriteMessage copies the frame
+// out, so a buffer is reusable as soon as writeFrame returns
+var framePool = sync.Pool{New: func() interface{} { return new(bytes.Buffer) }}
+
+// maxPooledFrame keeps an occasional huge frame from pinning its buffer in the pool
+const maxPooledFrame = 1 << 20
+
+// encodeFrame JSON-encodes v into a pooled buffer without HTML escaping,
+// which frames never need; release the buffer with releaseFrame
+func encodeFrame(v interface{}) (*bytes.Buffer, error) {
+	buf := framePool.Get().(*bytes.Buffer)
+	buf.Reset()
+	enc := json.NewEncoder(buf)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(v); err != nil {
+		releaseFrame(buf)
+		return nil, err
+	}
+	return buf, nil
+}
+
+// frameBytes returns the encoded frame without the Encoder's trailing newline
+func frameBytes(buf *bytes.Buffer) []byte {
+	b := buf.Bytes()
+	return b[:len(b)-1]
+}
+
+// releaseFrame returns buf to framePool
+func releaseFrame(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledFrame {
+		framePool.Put(buf)
+	}
+}
+
+// applyDefaultContext attaches the client's 7D context to messages that carry none
+func (c *Bridge) applyDefaultContext(msg *common.Message) {
+	if msg.Context == nil && c.options.Context != nil {
+		// Check if who key exists in the context map
+		if _, ok := c.options.Context["who"]; ok {
+			msg.Context = c.options.Context
 		}
-		if WriteTimeout > 0 {
-			err = c.conn.SetWriteDeadline(time.Now().Add(WriteTimeout))
-			if err != nil {
-				c.logger.Error("Failed to set write deadline: %v", err)
-			}
+	}
+}
+
+// writeFrame writes one encoded message frame
+func (c *Bridge) writeFrame(data []byte) error {
+	// Snapshot the connection under mu, then hold only writeMu for the
+	// network write, so close() and state checks never queue behind a
+	// slow or stalled write (gorilla allows Close concurrently with writes).
+	// A connection that already failed is not re-checked here: gorilla keeps
+	// returning its write error, which the error path below reports.
+	c.mu.Lock()
+	conn := c.conn
+	c.mu.Unlock()
+	if conn == nil {
+		return ErrBridgeNotConnected
+	}
+	c.writeMu.Lock()
+	if WriteTimeout > 0 {
+		if err := conn.SetWriteDeadline(time.Now().Add(WriteTimeout)); err != nil {
+			c.logger.Error("Failed to set write deadline: %v", err)
 		}
-		err = c.conn.WriteMessage(websocket.TextMessage, data)
-		if err != nil {
+	}
+	writeErr := conn.WriteMessage(websocket.TextMessage, data)
+	c.writeMu.Unlock()
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if writeErr != nil {
+		if c.conn == conn {
 			c.connected = false
-			return nil, fmt.Errorf("failed to write message: %w", err)
 		}
-		c.stats.MessagesSent++
-		c.stats.LastActive = time.Now()
-		return nil, nil
+		return fmt.Errorf("failed to write message: %w", writeErr)
 	}
-	_, err := fallbackSend()
-	return err
+	c.stats.MessagesSent++
+	c.stats.LastActive = time.Now()
+	return nil
 }
 
-// readPump continuously reads messages from the WebSocket
-func (c *Bridge) readPump() {
+// readPump continuously reads messages from conn. Only one pump runs at a time
+// and it is the only sender on messages: it either hands off to the pump of a
+// reconnected connection or, when it is the last one, closes messages on exit.
+func (c *Bridge) readPump(conn *websocket.Conn) {
 	// WHO: MessagePump
 	// WHAT: Read WebSocket messages
 	// WHEN: During connection lifetime
@@ -334,79 +413,106 @@ func (c *Bridge) readPump() {
 	// HOW: Using WebSocket events
 	// EXTENT: Connection lifetime
 
-	defer func() {
-		c.close()
-	}()
-
 	// Configure read deadline from common.go
 	if ReadTimeout > 0 {
-		err := c.conn.SetReadDeadline(time.Now().Add(ReadTimeout))
+		err := conn.SetReadDeadline(time.Now().Add(ReadTimeout))
 		if err != nil {
 			c.logger.Error("Failed to set read deadline: %v", err)
 		}
 	}
 
 	// Configure maximum message size from common.go
-	c.conn.SetReadLimit(MaxMessageSize)
+	conn.SetReadLimit(MaxMessageSize)
 
 	for {
 		// Reset the read deadline for each message
 		if ReadTimeout > 0 {
-			err := c.conn.SetReadDeadline(time.Now().Add(ReadTimeout))
+			err := conn.SetReadDeadline(time.Now().Add(ReadTimeout))
 			if err != nil {
 				c.logger.Error("Failed to reset read deadline: %v", err)
 			}
 		}
 
-		_, data, err := c.conn.ReadMessage()
+		_, data, err := conn.ReadMessage()
 		if err != nil {
-			c.logger.Error("Failed to read message: %v", err)
-			c.connected = false
-
-			// Try to reconnect
+			// Release the failed connection before reconnecting; a successful
+			// reconnect starts a new read pump that owns the new connection
+			c.close()
 			if c.ctx.Err() == nil {
-				c.reconnect()
+				c.logger.Error("Failed to read message: %v", err)
+				if c.reconnect() {
+					return
+				}
 			}
-
+			// No pump follows this one, so nothing sends on messages again
+			close(c.messages)
 			return
 		}
 
 		var msg common.Message
 		if err := json.Unmarshal(data, &msg); err != nil {
 			c.logger.Error("Failed to unmarshal message: %v", err)
+			c.mu.Lock()
 			c.stats.ErrorCount++
+			c.mu.Unlock()
 			continue
 		}
+		// One clock read per message serves both the default context time and stats
+		c.deliver(msg, time.Now())
+	}
+}
 
-		// Process context if needed
-		if ctxMap, ok := msg.Context.(map[string]interface{}); ok {
-			// Convert context map to ContextVector7D
-			contextVector := log.ContextVector7D{
-				Who:    getString(ctxMap, "who", "RemoteSystem"),
-				What:   getString(ctxMap, "what", "Communication"),
-				When:   getInt64(ctxMap, "when", time.Now().Unix()),
-				Where:  getString(ctxMap, "where", "RemoteLayer"),
-				Why:    getString(ctxMap, "why", "Response"),
-				How:    getString(ctxMap, "how", "WebSocket"),
-				Extent: getFloat64(ctxMap, "extent", 1.0),
-				Source: getString(ctxMap, "source", "External"),
-			}
-			msg.Context = contextVector
+// deliver converts an inbound message's context, records it in stats and
+// hands it to the bounded messages buffer
+func (c *Bridge) deliver(msg common.Message, now time.Time) {
+	// Process context if needed
+	if ctxMap, ok := msg.Context.(map[string]interface{}); ok {
+		// Convert context map to ContextVector7D
+		contextVector := log.ContextVector7D{
+			Who:    getString(ctxMap, "who", "RemoteSystem"),
+			What:   getString(ctxMap, "what", "Communication"),
+			When:   getInt64(ctxMap, "when", now.Unix()),
+			Where:  getString(ctxMap, "where", "RemoteLayer"),
+			Why:    getString(ctxMap, "why", "Response"),
+			How:    getString(ctxMap, "how", "WebSocket"),
+			Extent: getFloat64(ctxMap, "extent", 1.0),
+			Source: getString(ctxMap, "source", "External"),
 		}
+		msg.Context = contextVector
+	}
 
-		c.stats.MessagesReceived++
-		c.stats.LastActive = time.Now()
-
+	var dropped int64
+	select {
+	case c.messages <- msg:
+	default:
+		// The buffer is bounded: evict the oldest message so a stalled
+		// consumer sees the most recent traffic once it catches up
+		select {
+		case <-c.messages:
+			dropped++
+		default:
+		}
 		select {
 		case c.messages <- msg:
 		default:
-			c.logger.Warn("Message buffer full, dropping message")
+			dropped++
 		}
 	}
+
+	c.mu.Lock()
+	c.stats.MessagesReceived++
+	c.stats.LastActive = now
+	c.stats.MessagesDropped += dropped
+	totalDropped := c.stats.MessagesDropped
+	c.mu.Unlock()
+	if dropped > 0 {
+		c.logger.Warn("Message buffer full, dropped oldest message (%d dropped so far)", totalDropped)
+	}
 }
 
-// reconnect attempts to reestablish the WebSocket connection
-func (c *Bridge) reconnect() {
+// reconnect attempts to reestablish the WebSocket connection and reports
+// whether it started a read pump for the new connection
+func (c *Bridge) reconnect() bool {
 	// WHO: ReconnectionManager
 	// WHAT: Reconnect to bridge with fallback
 	// WHEN: During connection loss
@@ -424,41 +530,54 @@ func (c *Bridge) reconnect() {
 		retryDelay = 2 * time.Second
 	}
 	for i := 0; i < maxRetries; i++ {
-		_, err := func() (interface{}, error) {
-			c.logger.Info("Attempting to reconnect to bridge (attempt %d)", i+1)
-			err := c.connect()
-			if err == nil {
-				c.logger.Info("Successfully reconnected to bridge")
-				c.stats.ReconnectCount++
-				go c.readPump()
-				return nil, nil
-			}
-			c.logger.Error("Failed to reconnect (attempt %d): %v", i+1, err)
-			return nil, err
-		}()
+		c.logger.Info("Attempting to reconnect to bridge (attempt %d)", i+1)
+		err := c.connect()
 		if err == nil {
-			return
+			c.mu.Lock()
+			conn := c.conn
+			c.stats.ReconnectCount++
+			c.mu.Unlock()
+			if conn == nil || c.ctx.Err() != nil {
+				// Closed while reconnecting; drop a connection published after Close
+				c.close()
+				return false
+			}
+			c.logger.Info("Successfully reconnected to bridge")
+			go c.readPump(conn)
+			return true
+		}
+		c.logger.Error("Failed to reconnect (attempt %d): %v", i+1, err)
+		// Wait out the delay, but wake immediately if the client is closed
+		select {
+		case <-c.ctx.Done():
+			return false
+		case <-time.After(retryDelay):
 		}
-		time.Sleep(retryDelay)
 	}
 	c.logger.Error("Failed to reconnect after maximum attempts (%d)", maxRetries)
+	return false
+}
+
+// Close shuts the client down: cancels its context (stopping reconnects)
+// and closes the connection, after which the read pump closes the message
+// channel. It is safe to call more than once.
+func (c *Bridge) Close() {
+	c.cancelFunc()
+	c.close()
 }
 
-// close closes the WebSocket connection and cleans up resources
+// close closes the WebSocket connection and cleans up resources; it is idempotent
+// The connection is detached under mu and closed after it is released, so
+// Send and state checks never wait on the socket teardown
 func (c *Bridge) close() {
 	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	if c.conn != nil {
-		c.conn.Close()
-		c.conn = nil
-	}
-
+	conn := c.conn
+	c.conn = nil
 	c.connected = false
+	c.mu.Unlock()
 
-	// Close the message channel when we're shutting down
-	if c.ctx.Err() != nil {
-		close(c.messages)
+	if conn != nil {
+		conn.Close()
 	}
 }
 
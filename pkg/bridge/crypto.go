@@ -14,25 +14,28 @@ import (
 	"crypto/rand"
 	"crypto/sha256"
 	"encoding/hex"
-	"fmt"
+	"strconv"
 	"time"
 )
 
 // GenerateQuantumFingerprint creates a quantum-resistant fingerprint from a seed value
 // This implementation provides a SHA-256 based fingerprint suitable for bridge authentication
 func GenerateQuantumFingerprint(seed string) string {
-	// Create a unique fingerprint combining the seed with timestamp for uniqueness
-	timestamp := fmt.Sprintf("%d", time.Now().UnixNano())
-	data := seed + "-" + timestamp
-
 	// Generate some entropy
-	entropy := make([]byte, 16)
-	rand.Read(entropy)
-	
-	// Combine with input data
-	combined := fmt.Sprintf("%s-%x", data, entropy)
-	
-	// Hash the result
-	hash := sha256.Sum256([]byte(combined))
+	var entropy [16]byte
+	rand.Read(entropy[:])
+
+	// Hash "seed-<unix nanos>-<entropy>", assembled in one buffer rather
+	// than through fmt; the nanosecond timestamp keeps fingerprints unique.
+	// The entropy is hashed as raw bytes: hex-encoding it first only doubled
+	// the preimage without adding randomness
+	buf := make([]byte, 0, len(seed)+2+20+len(entropy))
+	buf = append(buf, seed...)
+	buf = append(buf, '-')
+	buf = strconv.AppendInt(buf, time.Now().UnixNano(), 10)
+	buf = append(buf, '-')
+	buf = append(buf, entropy[:]...)
+
+	hash := sha256.Sum256(buf)
 	return hex.EncodeToString(hash[:])
 }
@@ -43,22 +43,69 @@ var (
 var LoadBridgeFormulaRegistry = formularegistry.LoadBridgeFormulaRegistry
 var GetBridgeFormulaRegistry = formularegistry.GetBridgeFormulaRegistry
 
-// ConvertToContextVector7D converts a map[string]interface{} to a ContextVector7D
+// ConvertToContextVector7D converts a map[string]interface{} to a ContextVector7D.
+// Capitalized keys win over lowercase ones; the lowercase lookup and the clock
+// read for a missing "when" happen only when the earlier choice is absent.
 func ConvertToContextVector7D(m map[string]interface{}) log.ContextVector7D {
-	if m == nil {
-		m = make(map[string]interface{})
+	when, ok := contextInt64(m, "When", "when")
+	if !ok {
+		when = time.Now().Unix()
+	}
+	extent, ok := contextFloat64(m, "Extent", "extent")
+	if !ok {
+		extent = 1.0
 	}
-	
 	return log.ContextVector7D{
-		Who:    getString(m, "Who", getString(m, "who", "BridgeClient")),
-		What:   getString(m, "What", getString(m, "what", "Communication")),
-		When:   getInt64(m, "When", getInt64(m, "when", time.Now().Unix())),
-		Where:  getString(m, "Where", getString(m, "where", "SystemLayer6")),
-		Why:    getString(m, "Why", getString(m, "why", "Communication")),
-		How:    getString(m, "How", getString(m, "how", "WebSocket")),
-		Extent: getFloat64(m, "Extent", getFloat64(m, "extent", 1.0)),
-		Source: getString(m, "Source", getString(m, "source", "GitHubMCPServer")),
+		Who:    contextString(m, "Who", "who", "BridgeClient"),
+		What:   contextString(m, "What", "what", "Communication"),
+		When:   when,
+		Where:  contextString(m, "Where", "where", "SystemLayer6"),
+		Why:    contextString(m, "Why", "why", "Communication"),
+		How:    contextString(m, "How", "how", "WebSocket"),
+		Extent: extent,
+		Source: contextString(m, "Source", "source", "GitHubMCPServer"),
+	}
+}
+
+// contextString returns the first of m[upper], m[lower] holding a string, else defaultValue
+func contextString(m map[string]interface{}, upper, lower, defaultValue string) string {
+	if v, ok := m[upper].(string); ok {
+		return v
+	}
+	if v, ok := m[lower].(string); ok {
+		return v
+	}
+	return defaultValue
+}
+
+// contextInt64 returns the first of m[upper], m[lower] holding a number, as common.GetInt64 would
+func contextInt64(m map[string]interface{}, upper, lower string) (int64, bool) {
+	for _, key := range [2]string{upper, lower} {
+		switch v := m[key].(type) {
+		case int64:
+			return v, true
+		case int:
+			return int64(v), true
+		case float64:
+			return int64(v), true
+		}
+	}
+	return 0, false
+}
+
+// contextFloat64 returns the first of m[upper], m[lower] holding a number, as common.GetFloat64 would
+func contextFloat64(m map[string]interface{}, upper, lower string) (float64, bool) {
+	for _, key := range [2]string{upper, lower} {
+		switch v := m[key].(type) {
+		case float64:
+			return v, true
+		case int:
+			return float64(v), true
+		case int64:
+			return float64(v), true
+		}
 	}
+	return 0, false
 }
 
 // HasLoggerInContext checks if the given map has a logger
@@ -0,0 +1,28 @@
+// qhp.go
+// WHO: QHPProtocol
+// WHAT: Wire frames for the QHP handshake
+// WHEN: On every QHP-secured connection
+// WHERE: System Layer 6 (Integration)
+// WHY: To share one frame definition between client and server
+// HOW: Typed JSON structs
+// EXTENT: All QHP handshakes
+
+package bridge
+
+// QHPHandshake is the opening frame a client sends on a QHP-secured connection.
+// Typed fields let encoding/json use its cached struct codec instead of
+// reflecting over a map[string]interface{} on every handshake.
+type QHPHandshake struct {
+	Type          string `json:"type"`
+	Fingerprint   string `json:"fingerprint"`
+	Timestamp     int64  `json:"timestamp,omitempty"`
+	OverrideToken string `json:"override_token,omitempty"`
+}
+
+// QHPHandshakeAck is the server's reply to a QHPHandshake
+type QHPHandshakeAck struct {
+	Type        string                   `json:"type"`
+	Fingerprint string                   `json:"fingerprint"`
+	SessionKey  string                   `json:"session_key"`
+	TrustTable  map[string]TrustMetadata `json:"trust_table"`
+}
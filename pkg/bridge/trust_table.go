@@ -21,9 +21,20 @@ type TrustMetadata struct {
 	Meta       map[string]interface{}
 }
 
+// TrustEntryTTL is how long a peer stays trusted after its last handshake
+const TrustEntryTTL = time.Hour
+
+// trustExpiry records when a fingerprint was (re)trusted. Every entry gets the
+// same TTL, so append order is expiry order and a FIFO stands in for a heap
+type trustExpiry struct {
+	fingerprint string
+	timestamp   int64
+}
+
 type TrustTable struct {
-	mu    sync.RWMutex
-	peers map[string]TrustMetadata
+	mu     sync.RWMutex
+	peers  map[string]TrustMetadata
+	expiry []trustExpiry
 }
 
 var trustTableInstance *TrustTable
@@ -39,29 +50,77 @@ func GetTrustTable() *TrustTable {
 }
 
 func (t *TrustTable) Update(fingerprint, sessionKey string, meta map[string]interface{}) {
+	t.updateAt(fingerprint, sessionKey, meta, time.Now().Unix())
+}
+
+func (t *TrustTable) updateAt(fingerprint, sessionKey string, meta map[string]interface{}, now int64) {
 	t.mu.Lock()
 	defer t.mu.Unlock()
+	t.decayLocked(now)
 	t.peers[fingerprint] = TrustMetadata{
 		Fingerprint: fingerprint,
-		Timestamp:  time.Now().Unix(),
+		Timestamp:  now,
 		SessionKey: sessionKey,
 		Meta:       meta,
 	}
+	t.expiry = append(t.expiry, trustExpiry{fingerprint: fingerprint, timestamp: now})
+}
+
+// trustCutoff is the newest handshake time that has expired at now
+func trustCutoff(now int64) int64 {
+	return now - int64(TrustEntryTTL/time.Second)
+}
+
+// decayLocked pops the expired prefix of the expiry queue; cost is proportional
+// to the entries evicted, not the table size. A peer re-trusted since its
+// queue entry was pushed has a newer timestamp and is left in place
+func (t *TrustTable) decayLocked(now int64) {
+	cutoff := trustCutoff(now)
+	n := 0
+	for n < len(t.expiry) && t.expiry[n].timestamp <= cutoff {
+		e := t.expiry[n]
+		if meta, ok := t.peers[e.fingerprint]; ok && meta.Timestamp == e.timestamp {
+			delete(t.peers, e.fingerprint)
+		}
+		n++
+	}
+	if n > 0 {
+		clear(t.expiry[:n])
+		t.expiry = t.expiry[n:]
+	}
 }
 
+// Get returns the trust metadata for a peer whose handshake has not expired.
+// Readers skip expired entries themselves, so expiry does not depend on
+// another peer handshaking; Update evicts them
 func (t *TrustTable) Get(fingerprint string) (TrustMetadata, bool) {
+	return t.getAt(fingerprint, time.Now().Unix())
+}
+
+func (t *TrustTable) getAt(fingerprint string, now int64) (TrustMetadata, bool) {
 	t.mu.RLock()
 	defer t.mu.RUnlock()
 	meta, ok := t.peers[fingerprint]
-	return meta, ok
+	if !ok || meta.Timestamp <= trustCutoff(now) {
+		return TrustMetadata{}, false
+	}
+	return meta, true
 }
 
+// All returns a copy of the peers whose handshake has not expired
 func (t *TrustTable) All() map[string]TrustMetadata {
+	return t.allAt(time.Now().Unix())
+}
+
+func (t *TrustTable) allAt(now int64) map[string]TrustMetadata {
+	cutoff := trustCutoff(now)
 	t.mu.RLock()
 	defer t.mu.RUnlock()
-	copy := make(map[string]TrustMetadata)
+	copy := make(map[string]TrustMetadata, len(t.peers))
 	for k, v := range t.peers {
-		copy[k] = v
+		if v.Timestamp > cutoff {
+			copy[k] = v
+		}
 	}
 	return copy
 }
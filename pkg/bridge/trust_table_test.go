@@ -0,0 +1,72 @@
+/*
+ * WHO: TrustTableTester
+ * WHAT: Tests for trust table expiry
+ * WHEN: During test execution
+ * WHERE: System Layer 6 (Integration) / Test Environment
+ * WHY: To validate that peers expire TrustEntryTTL after their last handshake
+ * HOW: Using Go's testing framework with explicit handshake times
+ * EXTENT: TrustTable updates, lookups and eviction
+ */
+
+package bridge
+
+import (
+	"testing"
+	"time"
+)
+
+func newTestTrustTable() *TrustTable {
+	return &TrustTable{peers: make(map[string]TrustMetadata)}
+}
+
+func TestTrustTableExpiresEntries(t *testing.T) {
+	ttl := int64(TrustEntryTTL / time.Second)
+	table := newTestTrustTable()
+	table.updateAt("peer-a", "key-a", nil, 1000)
+
+	if meta, ok := table.getAt("peer-a", 1000+ttl-1); !ok || meta.SessionKey != "key-a" {
+		t.Fatalf("getAt before TTL = %+v, %v; want key-a, true", meta, ok)
+	}
+	// Readers hide the entry once it expires, even before anything evicts it
+	if _, ok := table.getAt("peer-a", 1000+ttl); ok {
+		t.Fatal("getAt at TTL returned an expired peer")
+	}
+	if all := table.allAt(1000 + ttl); len(all) != 0 {
+		t.Fatalf("allAt at TTL = %v; want no peers", all)
+	}
+
+	// The next update evicts it from the table and the expiry queue
+	table.updateAt("peer-b", "key-b", nil, 1000+ttl)
+	if _, ok := table.peers["peer-a"]; ok {
+		t.Fatal("expired peer-a was not evicted by updateAt")
+	}
+	if len(table.expiry) != 1 || table.expiry[0].fingerprint != "peer-b" {
+		t.Fatalf("expiry queue = %+v; want only peer-b", table.expiry)
+	}
+}
+
+func TestTrustTableRetrustKeepsPeer(t *testing.T) {
+	ttl := int64(TrustEntryTTL / time.Second)
+	table := newTestTrustTable()
+	table.updateAt("peer-a", "old", nil, 1000)
+	table.updateAt("peer-a", "new", nil, 1500)
+
+	// The first queue entry expires, but the peer was re-trusted since
+	table.updateAt("peer-b", "key-b", nil, 1000+ttl)
+	meta, ok := table.getAt("peer-a", 1000+ttl)
+	if !ok || meta.SessionKey != "new" {
+		t.Fatalf("re-trusted peer-a = %+v, %v; want new, true", meta, ok)
+	}
+	if all := table.allAt(1000 + ttl); len(all) != 2 {
+		t.Fatalf("allAt = %v; want peer-a and peer-b", all)
+	}
+
+	// Its second entry expires on schedule
+	table.updateAt("peer-b", "key-b", nil, 1500+ttl)
+	if _, ok := table.getAt("peer-a", 1500+ttl); ok {
+		t.Fatal("peer-a outlived its latest handshake")
+	}
+	if _, ok := table.peers["peer-a"]; ok {
+		t.Fatal("peer-a was not evicted after its latest handshake expired")
+	}
+}
@@ -94,6 +94,7 @@ type DisconnectHandler func(reason string)
 type BridgeStats struct {
 	MessagesSent     int64
 	MessagesReceived int64
+	MessagesDropped  int64 // received messages evicted from a full buffer
 	ErrorCount       int64
 	ReconnectCount   int64
 	LastActive       time.Time
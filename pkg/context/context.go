@@ -213,27 +213,11 @@ func (co *ContextOrchestrator) handleContextTransformation(trigger tspeak.ATMTri
 }
 
 func (co *ContextOrchestrator) handleContextToMap(trigger tspeak.ATMTrigger) error {
-	contextVector, ok := trigger.Payload["context"].(ContextVector7D)
-	if !ok {
+	// The map form has no consumer on this trigger path, so only the payload is
+	// validated; callers that need the map use log.ToMap directly
+	if _, ok := trigger.Payload["context"].(ContextVector7D); !ok {
 		return fmt.Errorf("neural mapping failed: invalid context vector")
 	}
-	// Convert to map using neural processing
-	resultMap := map[string]interface{}{
-		"who":    contextVector.Who,
-		"what":   contextVector.What,
-		"when":   contextVector.When,
-		"where":  contextVector.Where,
-		"why":    contextVector.Why,
-		"how":    contextVector.How,
-		"extent": contextVector.Extent,
-	}
-	if contextVector.Source != "" {
-		resultMap["source"] = contextVector.Source
-	}
-	if len(contextVector.Meta) > 0 {
-		resultMap["meta"] = contextVector.Meta
-	}
-	// Optionally: log or process resultMap
 	return nil
 }
 
@@ -43,22 +43,21 @@ func BridgeContextsAndSync(ctx context.Context) context.Context {
 
 // BridgeMCPContext bridges GitHub and TNOS 7D context vectors
 func BridgeMCPContext(githubCtx GitHubContext, tnosCtx *ContextVector7D, logger logpkg.LoggerInterface) ContextVector7D {
-	// Create a new 7D vector from GitHub context fields
-	contextMap := map[string]interface{}{
-		"who":    githubCtx.User,
-		"what":   githubCtx.Operation,
-		"when":   githubCtx.Timestamp,
-		"where":  tnosCtx.Where,
-		"why":    githubCtx.Purpose,
-		"how":    githubCtx.Type,
-		"extent": githubCtx.Scope,
-		"source": githubCtx.Source,
+	// Map GitHub context fields straight onto the 7D vector; the field mapping
+	// is fixed, so there is no need to stage it in a map and read it back out
+	newCV := ContextVector7D{
+		Who:    githubCtx.User,
+		What:   githubCtx.Operation,
+		When:   githubCtx.Timestamp,
+		Where:  tnosCtx.Where,
+		Why:    githubCtx.Purpose,
+		How:    githubCtx.Type,
+		Extent: githubCtx.Scope,
+		Source: githubCtx.Source,
 	}
 	
-	newCV := logpkg.FromMap(contextMap)
-	
-	if logger != nil {
-		logger.Info("Bridged 7D context", "user", githubCtx.User, "operation", githubCtx.Operation)
+	if logger != nil && logpkg.Enabled(logger, logpkg.LevelInfo) {
+		logger.Info("Bridged 7D context: user=%s operation=%s", githubCtx.User, githubCtx.Operation)
 	}
 	
 	return newCV
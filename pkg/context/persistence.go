@@ -13,6 +13,7 @@ package context
 import (
 	"encoding/json"
 	"fmt"
+	"strconv"
 	"time"
 
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/log"
@@ -258,23 +259,26 @@ func (cp *ContextPersistence) StoreContext(context *ContextVector7D) (*ContextSt
 	// HOW: Using ATM triggers to initiate storage through helical memory
 	// EXTENT: All external context storage requests
 
+	// One clock read serves the context ID and every StorageTime below
+	now := time.Now()
+
 	if context == nil {
 		return &ContextStorageResult{
 			Success:      false,
-			StorageTime:  time.Now(),
+			StorageTime:  now,
 			ErrorMessage: "nil context provided",
 		}, fmt.Errorf("cannot store nil context")
 	}
 
 	// Generate context ID
-	contextID := fmt.Sprintf("ctx_%d_%s", time.Now().UnixNano(), context.Who)
+	contextID := "ctx_" + strconv.FormatInt(now.UnixNano(), 10) + "_" + context.Who
 
 	// Serialize context for storage
 	contextData, err := json.Marshal(context)
 	if err != nil {
 		return &ContextStorageResult{
 			Success:      false,
-			StorageTime:  time.Now(),
+			StorageTime:  now,
 			ContextID:    contextID,
 			ErrorMessage: err.Error(),
 		}, fmt.Errorf("failed to serialize context: %w", err)
@@ -290,7 +294,7 @@ func (cp *ContextPersistence) StoreContext(context *ContextVector7D) (*ContextSt
 	if err != nil {
 		return &ContextStorageResult{
 			Success:      false,
-			StorageTime:  time.Now(),
+			StorageTime:  now,
 			ContextID:    contextID,
 			ErrorMessage: err.Error(),
 		}, fmt.Errorf("failed to trigger context storage: %w", err)
@@ -298,7 +302,7 @@ func (cp *ContextPersistence) StoreContext(context *ContextVector7D) (*ContextSt
 
 	return &ContextStorageResult{
 		Success:     true,
-		StorageTime: time.Now(),
+		StorageTime: now,
 		ContextID:   contextID,
 	}, nil
 }
@@ -25,6 +25,28 @@ import (
 // SymbolMapping holds the mapping from formula names to canonical TranquilSpeak symbols
 var SymbolMapping = make(map[string]string)
 
+// symbolFormulaIDs is the reverse of SymbolMapping (symbol -> formula IDs), kept in
+// step by setSymbolMapping so symbol lookups are a map hit instead of a registry scan
+var symbolFormulaIDs = make(map[string][]string)
+
+// setSymbolMapping records id -> symbol in SymbolMapping and its reverse index
+func setSymbolMapping(id, symbol string) {
+	if old, ok := SymbolMapping[id]; ok {
+		if old == symbol {
+			return
+		}
+		ids := symbolFormulaIDs[old]
+		for i, existing := range ids {
+			if existing == id {
+				symbolFormulaIDs[old] = append(ids[:i:i], ids[i+1:]...)
+				break
+			}
+		}
+	}
+	SymbolMapping[id] = symbol
+	symbolFormulaIDs[symbol] = append(symbolFormulaIDs[symbol], id)
+}
+
 // FormulaRegistryData represents the structure of formulas.json
 type FormulaRegistryData struct {
 	RegistryVersion     string `json:"registry_version"`
@@ -62,7 +84,7 @@ func LoadSymbolMapping(path string) error {
 				formulaName := strings.TrimSpace(fields[1])
 				tranquilSym := strings.TrimSpace(fields[5])
 				if formulaName != "" && tranquilSym != "" {
-					SymbolMapping[formulaName] = tranquilSym
+					setSymbolMapping(formulaName, tranquilSym)
 				}
 			}
 		}
@@ -72,27 +94,40 @@ func LoadSymbolMapping(path string) error {
 
 // LoadSymbolMappingFromJSON loads TranquilSpeak symbol mapping from formulas.json
 func LoadSymbolMappingFromJSON(path string) error {
-	file, err := os.Open(path)
+	raw, err := os.ReadFile(path)
 	if err != nil {
 		return fmt.Errorf("failed to open formulas.json: %w", err)
 	}
-	defer file.Close()
 
-	var data FormulaRegistryData
-	if err := json.NewDecoder(file).Decode(&data); err != nil {
+	// Decode only the two fields the mapping needs; the decoder skips the
+	// names, descriptions and input/output/tag arrays instead of allocating them
+	var data struct {
+		Formulas []struct {
+			ID                  string `json:"id"`
+			TranquilSpeakSymbol string `json:"tranquilspeak_symbol"`
+		} `json:"formulas"`
+	}
+	if err := json.Unmarshal(raw, &data); err != nil {
 		return fmt.Errorf("failed to decode formulas.json: %w", err)
 	}
 
-	// Build symbol mapping from JSON data
+	// Build symbol mapping from JSON data; report lines are written in one flush
+	out := bufio.NewWriter(os.Stdout)
 	for _, formula := range data.Formulas {
-		if formula.TranquilSpeakSymbol != "" {
-			SymbolMapping[formula.ID] = formula.TranquilSpeakSymbol
-			fmt.Printf("Loaded formula symbol mapping: %s -> %s\n", formula.ID, formula.TranquilSpeakSymbol)
-		}
+		addSymbolMapping(out, formula.ID, formula.TranquilSpeakSymbol)
 	}
 
-	fmt.Printf("Loaded %d TranquilSpeak symbol mappings from %s\n", len(SymbolMapping), path)
-	return nil
+	fmt.Fprintf(out, "Loaded %d TranquilSpeak symbol mappings from %s\n", len(SymbolMapping), path)
+	return out.Flush()
+}
+
+// addSymbolMapping records a formula's TranquilSpeak symbol if it has one and
+// reports it to out, which callers buffer and flush once per load
+func addSymbolMapping(out *bufio.Writer, id, symbol string) {
+	if symbol != "" {
+		setSymbolMapping(id, symbol)
+		fmt.Fprintf(out, "Loaded formula symbol mapping: %s -> %s\n", id, symbol)
+	}
 }
 
 // BridgeFormula represents a formula definition that can be executed by the blood bridge
@@ -125,28 +160,35 @@ func LoadBridgeFormulaRegistry(path string) error {
 		
 		// Try to load from JSON file if provided
 		if path != "" {
-			// First, load the symbol mapping from the same JSON file
-			if e := LoadSymbolMappingFromJSON(path); e != nil {
-				fmt.Printf("Warning: failed to load symbol mapping from JSON: %v\n", e)
-			}
-			
-			f, e := os.Open(path)
+			// Read and decode the file once; each entry carries both the bridge
+			// formula and its TranquilSpeak symbol mapping
+			raw, e := os.ReadFile(path)
 			if e != nil {
+				fmt.Printf("Warning: failed to load symbol mapping from JSON: %v\n", e)
 				err = fmt.Errorf("failed to open formula registry: %w", e)
 				// Continue with an empty registry and add default formulas
 			} else {
-				defer f.Close()
 				var data struct {
-					Formulas []BridgeFormula `json:"formulas"`
+					Formulas []struct {
+						BridgeFormula
+						TranquilSpeakSymbol string `json:"tranquilspeak_symbol"`
+					} `json:"formulas"`
 				}
-				if e := json.NewDecoder(f).Decode(&data); e != nil {
+				if e := json.Unmarshal(raw, &data); e != nil {
+					fmt.Printf("Warning: failed to load symbol mapping from JSON: %v\n", e)
 					err = fmt.Errorf("failed to decode formula registry: %w", e)
 					// Continue with an empty registry and add default formulas
 				} else {
-					// Add formulas from the file
-					for _, formula := range data.Formulas {
-						bridgeRegistryInstance.formulas[formula.ID] = formula
+					// Add formulas and symbol mappings from the file, sizing the
+					// registry once instead of growing it entry by entry
+					bridgeRegistryInstance.formulas = make(map[string]BridgeFormula, len(data.Formulas))
+					out := bufio.NewWriter(os.Stdout)
+					for _, entry := range data.Formulas {
+						addSymbolMapping(out, entry.ID, entry.TranquilSpeakSymbol)
+						bridgeRegistryInstance.formulas[entry.ID] = entry.BridgeFormula
 					}
+					fmt.Fprintf(out, "Loaded %d TranquilSpeak symbol mappings from %s\n", len(SymbolMapping), path)
+					out.Flush()
 				}
 			}
 		}
@@ -159,43 +201,83 @@ func LoadBridgeFormulaRegistry(path string) error {
 	return err
 }
 
-// addDefaultTNOSMCPFormulas adds the default formulas needed for TNOS MCP communication
-func addDefaultTNOSMCPFormulas(registry *BridgeFormulaRegistry) {
-	// Hemoflux compression formula (delegates to HemoFlux system for actual compression)
-	registry.AddFormula(BridgeFormula{
-		ID:          "hemoflux.compress",
-		Description: "Compresses data using the HemoFlux system with Möbius Equation",
-		HemofluxID:  "mobius_compress",
-		ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
-		Parameters: map[string]interface{}{
-			"type":          "compression",
-			"input_format":  "json",
-			"output_format": "json",
-			"version":       "3.0",
-		},
-		Metadata: map[string]interface{}{
-			"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_compress",
-			"category":       "hemoflux",
+// criticalHemofluxFormulas returns fresh copies of the formulas the blood bridge cannot run
+// without, as registered by the registry defaults; EnsureHemofluxFormulas restores
+// them through hemofluxRecoveryFormulas
+func criticalHemofluxFormulas() []BridgeFormula {
+	return []BridgeFormula{
+		{
+			ID:          "hemoflux.compress",
+			Description: "Compresses data using the HemoFlux system with Möbius Equation",
+			HemofluxID:  "mobius_compress",
+			ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
+			Parameters: map[string]interface{}{
+				"type":          "compression",
+				"input_format":  "json",
+				"output_format": "json",
+				"version":       "3.0",
+			},
+			Metadata: map[string]interface{}{
+				"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_compress",
+				"category":       "hemoflux",
+			},
 		},
-	})
-	
-	// Hemoflux decompression formula (delegates to HemoFlux system for actual decompression)
-	registry.AddFormula(BridgeFormula{
-		ID:          "hemoflux.decompress",
-		Description: "Decompresses data using the HemoFlux system with Möbius Equation",
-		HemofluxID:  "mobius_decompress",
-		ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
-		Parameters: map[string]interface{}{
-			"type":          "decompression",
-			"input_format":  "json",
-			"output_format": "json",
-			"version":       "3.0",
+		{
+			ID:          "hemoflux.decompress",
+			Description: "Decompresses data using the HemoFlux system with Möbius Equation",
+			HemofluxID:  "mobius_decompress",
+			ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
+			Parameters: map[string]interface{}{
+				"type":          "decompression",
+				"input_format":  "json",
+				"output_format": "json",
+				"version":       "3.0",
+			},
+			Metadata: map[string]interface{}{
+				"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_decompress",
+				"category":       "hemoflux",
+			},
 		},
-		Metadata: map[string]interface{}{
-			"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_decompress",
-			"category":       "hemoflux",
+		{
+			ID:          "blood.oxygenate",
+			Description: "Oxygenates blood cells with 7D context for improved data transfer",
+			Parameters: map[string]interface{}{
+				"type":    "enrichment",
+				"version": "3.0",
+			},
+			Metadata: map[string]interface{}{
+				"category": "blood_flow",
+			},
 		},
-	})
+	}
+}
+
+// hemofluxRecoveryFormulas returns the formulas EnsureHemofluxFormulas restores. They
+// match criticalHemofluxFormulas except blood.oxygenate, which recovery registers as
+// an "oxygenation" formula in the "blood" category rather than the defaults'
+// "enrichment" formula in "blood_flow"
+func hemofluxRecoveryFormulas() []BridgeFormula {
+	formulas := criticalHemofluxFormulas()
+	for i := range formulas {
+		if formulas[i].ID == "blood.oxygenate" {
+			formulas[i].Parameters = map[string]interface{}{
+				"type":    "oxygenation",
+				"version": "3.0",
+			}
+			formulas[i].Metadata = map[string]interface{}{
+				"category": "blood",
+			}
+		}
+	}
+	return formulas
+}
+
+// addDefaultTNOSMCPFormulas adds the default formulas needed for TNOS MCP communication
+func addDefaultTNOSMCPFormulas(registry *BridgeFormulaRegistry) {
+	// Critical Hemoflux formulas (compression, decompression, blood oxygenation)
+	for _, formula := range criticalHemofluxFormulas() {
+		registry.AddFormula(formula)
+	}
 	
 	// TNOS Translation formula
 	registry.AddFormula(BridgeFormula{
@@ -227,19 +309,6 @@ func addDefaultTNOSMCPFormulas(registry *BridgeFormulaRegistry) {
 		},
 	})
 	
-	// Blood oxygenation formula
-	registry.AddFormula(BridgeFormula{
-		ID:          "blood.oxygenate",
-		Description: "Oxygenates blood cells with 7D context for improved data transfer",
-		Parameters: map[string]interface{}{
-			"type":    "enrichment",
-			"version": "3.0",
-		},
-		Metadata: map[string]interface{}{
-			"category": "blood_flow",
-		},
-	})
-	
 	// QHP (Quantum Handshake Protocol) formula
 	registry.AddFormula(BridgeFormula{
 		ID:          "qhp.handshake",
@@ -621,12 +690,6 @@ func addDefaultTNOSMCPFormulas(registry *BridgeFormulaRegistry) {
     })
 }
 
-// Remove registry/symbol mapping loading from init(). Only register formula functions if mapping is already loaded.
-func init() {
-	// Only register formula functions if SymbolMapping is already loaded (by main.go)
-	// (No computation functions are registered here; registration is external.)
-}
-
 // GetBridgeFormulaRegistry returns the singleton registry instance
 // NOTE: The registry must be initialized by main.go before use.
 func GetBridgeFormulaRegistry() *BridgeFormulaRegistry {
@@ -647,69 +710,9 @@ func (r *BridgeFormulaRegistry) EnsureHemofluxFormulas() {
 	defer r.mu.Unlock()
 
 	// Check and add critical formulas if not present
-	criticalFormulas := []struct {
-		ID          string
-		Description string
-		HemofluxID  string
-		ContextReqs []string
-		Parameters  map[string]interface{}
-		Metadata    map[string]interface{}
-	}{
-		{
-			ID:          "hemoflux.compress",
-			Description: "Compresses data using the HemoFlux system with Möbius Equation",
-			HemofluxID:  "mobius_compress",
-			ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
-			Parameters: map[string]interface{}{
-				"type":          "compression",
-				"input_format":  "json",
-				"output_format": "json",
-				"version":       "3.0",
-			},
-			Metadata: map[string]interface{}{
-				"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_compress",
-				"category":       "hemoflux",
-			},
-		},
-		{
-			ID:          "hemoflux.decompress",
-			Description: "Decompresses data using the HemoFlux system with Möbius Equation",
-			HemofluxID:  "mobius_decompress",
-			ContextReqs: []string{"who", "what", "when", "where", "why", "how", "extent"},
-			Parameters: map[string]interface{}{
-				"type":          "decompression",
-				"input_format":  "json", 
-				"output_format": "json",
-				"version":       "3.0",
-			},
-			Metadata: map[string]interface{}{
-				"canonical_path": "/systems/cpp/circulatory/algorithms/formula_registry/mobius_decompress",
-				"category":       "hemoflux",
-			},
-		},
-		{
-			ID:          "blood.oxygenate",
-			Description: "Oxygenates blood cells with 7D context for improved data transfer",
-			Parameters: map[string]interface{}{
-				"type":          "oxygenation",
-				"version":       "3.0",
-			},
-			Metadata: map[string]interface{}{
-				"category": "blood",
-			},
-		},
-	}
-
-	for _, formula := range criticalFormulas {
+	for _, formula := range hemofluxRecoveryFormulas() {
 		if _, exists := r.formulas[formula.ID]; !exists {
-			r.formulas[formula.ID] = BridgeFormula{
-				ID:          formula.ID,
-				Description: formula.Description,
-				HemofluxID:  formula.HemofluxID,
-				ContextReqs: formula.ContextReqs,
-				Parameters:  formula.Parameters,
-				Metadata:    formula.Metadata,
-			}
+			r.formulas[formula.ID] = formula
 		}
 	}
 }
@@ -727,9 +730,9 @@ func (r *BridgeFormulaRegistry) GetFormulaBySymbol(symbol string) (BridgeFormula
 	r.mu.RLock()
 	defer r.mu.RUnlock()
 	
-	// Find formula by matching TranquilSpeak symbol
-	for _, formula := range r.formulas {
-		if mappedSymbol, exists := SymbolMapping[formula.ID]; exists && mappedSymbol == symbol {
+	// Resolve through the reverse symbol index rather than scanning every formula
+	for _, id := range symbolFormulaIDs[symbol] {
+		if formula, exists := r.formulas[id]; exists {
 			return formula, true
 		}
 	}
@@ -0,0 +1,136 @@
+/*
+ * WHO: FormulaRegistryTester
+ * WHAT: Tests for the TranquilSpeak symbol index and Hemoflux defaults
+ * WHEN: During test execution
+ * WHERE: System Layer 6 (Integration) / Test Environment
+ * WHY: To keep symbol lookups consistent with SymbolMapping
+ * HOW: Using Go's testing framework against the package-level mapping
+ * EXTENT: setSymbolMapping, GetFormulaBySymbol, GetFormulaByName, Hemoflux defaults
+ */
+
+package formularegistry
+
+import (
+	"reflect"
+	"testing"
+)
+
+// resetSymbolMapping gives the test empty mappings and restores the originals afterwards
+func resetSymbolMapping(t *testing.T) {
+	t.Helper()
+	savedMapping, savedIndex := SymbolMapping, symbolFormulaIDs
+	SymbolMapping = make(map[string]string)
+	symbolFormulaIDs = make(map[string][]string)
+	t.Cleanup(func() {
+		SymbolMapping, symbolFormulaIDs = savedMapping, savedIndex
+	})
+}
+
+// checkSymbolIndex fails unless symbolFormulaIDs is exactly the reverse of SymbolMapping
+func checkSymbolIndex(t *testing.T) {
+	t.Helper()
+	indexed := 0
+	for symbol, ids := range symbolFormulaIDs {
+		for _, id := range ids {
+			if SymbolMapping[id] != symbol {
+				t.Errorf("index lists %q under %q, but SymbolMapping has %q", id, symbol, SymbolMapping[id])
+			}
+		}
+		indexed += len(ids)
+	}
+	if indexed != len(SymbolMapping) {
+		t.Errorf("index holds %d IDs; SymbolMapping has %d", indexed, len(SymbolMapping))
+	}
+}
+
+func TestSetSymbolMappingKeepsIndexInStep(t *testing.T) {
+	resetSymbolMapping(t)
+
+	setSymbolMapping("alpha", "Σ")
+	setSymbolMapping("beta", "Σ")
+	checkSymbolIndex(t)
+
+	// Setting the same mapping again must not duplicate the index entry
+	setSymbolMapping("alpha", "Σ")
+	checkSymbolIndex(t)
+
+	// Remapping moves the ID from its old symbol to the new one
+	setSymbolMapping("alpha", "Ω")
+	checkSymbolIndex(t)
+	if ids := symbolFormulaIDs["Σ"]; len(ids) != 1 || ids[0] != "beta" {
+		t.Fatalf("Σ indexes %v after remapping alpha; want [beta]", ids)
+	}
+	if ids := symbolFormulaIDs["Ω"]; len(ids) != 1 || ids[0] != "alpha" {
+		t.Fatalf("Ω indexes %v; want [alpha]", ids)
+	}
+}
+
+func TestGetFormulaBySymbolUsesIndex(t *testing.T) {
+	resetSymbolMapping(t)
+	registry := &BridgeFormulaRegistry{formulas: map[string]BridgeFormula{
+		"alpha": {ID: "alpha"},
+		"beta":  {ID: "beta"},
+	}}
+
+	// IDs without a registered formula are skipped
+	setSymbolMapping("unregistered", "Σ")
+	setSymbolMapping("alpha", "Σ")
+	setSymbolMapping("beta", "Ω")
+
+	if f, ok := registry.GetFormulaBySymbol("Σ"); !ok || f.ID != "alpha" {
+		t.Fatalf("GetFormulaBySymbol(Σ) = %q, %v; want alpha", f.ID, ok)
+	}
+	if f, ok := registry.GetFormulaByName("beta"); !ok || f.ID != "beta" {
+		t.Fatalf("GetFormulaByName(beta) = %q, %v; want beta", f.ID, ok)
+	}
+
+	setSymbolMapping("alpha", "Ω")
+	if _, ok := registry.GetFormulaBySymbol("Σ"); ok {
+		t.Fatal("GetFormulaBySymbol(Σ) still resolves after alpha moved to Ω")
+	}
+	if _, ok := registry.GetFormulaBySymbol("missing"); ok {
+		t.Fatal("GetFormulaBySymbol resolved an unknown symbol")
+	}
+}
+
+func TestHemofluxFormulaVariants(t *testing.T) {
+	defaults := &BridgeFormulaRegistry{formulas: make(map[string]BridgeFormula)}
+	addDefaultTNOSMCPFormulas(defaults)
+	recovered := &BridgeFormulaRegistry{formulas: make(map[string]BridgeFormula)}
+	recovered.EnsureHemofluxFormulas()
+
+	// blood.oxygenate keeps distinct parameters in the defaults and in recovery
+	tests := []struct {
+		name     string
+		registry *BridgeFormulaRegistry
+		params   map[string]interface{}
+		metadata map[string]interface{}
+	}{
+		{"defaults", defaults, map[string]interface{}{"type": "enrichment", "version": "3.0"}, map[string]interface{}{"category": "blood_flow"}},
+		{"recovery", recovered, map[string]interface{}{"type": "oxygenation", "version": "3.0"}, map[string]interface{}{"category": "blood"}},
+	}
+	for _, tt := range tests {
+		f, ok := tt.registry.GetFormula("blood.oxygenate")
+		if !ok {
+			t.Fatalf("%s: blood.oxygenate not registered", tt.name)
+		}
+		if !reflect.DeepEqual(f.Parameters, tt.params) || !reflect.DeepEqual(f.Metadata, tt.metadata) {
+			t.Errorf("%s: blood.oxygenate params=%v metadata=%v; want %v, %v", tt.name, f.Parameters, f.Metadata, tt.params, tt.metadata)
+		}
+	}
+
+	// The Hemoflux compression formulas are identical in both
+	for _, id := range []string{"hemoflux.compress", "hemoflux.decompress"} {
+		d, _ := defaults.GetFormula(id)
+		r, ok := recovered.GetFormula(id)
+		if !ok || !reflect.DeepEqual(d, r) {
+			t.Errorf("%s differs between defaults and recovery: %+v vs %+v", id, d, r)
+		}
+	}
+
+	// Recovery never overwrites a formula that is already registered
+	defaults.EnsureHemofluxFormulas()
+	if f, _ := defaults.GetFormula("blood.oxygenate"); f.Parameters["type"] != "enrichment" {
+		t.Errorf("EnsureHemofluxFormulas replaced an existing blood.oxygenate: %v", f.Parameters)
+	}
+}
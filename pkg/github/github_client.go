@@ -60,6 +60,10 @@ const (
 	DefaultUserAgent      = "TNOS-GitHub-MCP-Client"
 	DefaultTimeout        = 30 * time.Second
 	DefaultCacheTimeout   = 5 * time.Minute
+
+	// DefaultMaxIdleConnsPerHost is how many authenticated TLS connections to
+	// the API host stay pooled between requests (net/http keeps only 2)
+	DefaultMaxIdleConnsPerHost = 16
 )
 
 // Resource type constants
@@ -211,7 +215,13 @@ func NewAdvancedClient(options ClientOptions) (*Client, error) {
 	ts := oauth2.StaticTokenSource(
 		&oauth2.Token{AccessToken: options.Token},
 	)
-	httpClient := oauth2.NewClient(context.Background(), ts)
+	// Base the OAuth2 client on a transport that keeps enough idle connections
+	// for concurrent tool calls, so bursts reuse warm TLS sessions instead of
+	// closing all but two and handshaking again on the next burst
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = DefaultMaxIdleConnsPerHost
+	baseCtx := context.WithValue(context.Background(), oauth2.HTTPClient, &http.Client{Transport: transport})
+	httpClient := oauth2.NewClient(baseCtx, ts)
 	httpClient.Timeout = options.Timeout
 
 	// Create GraphQL client
@@ -21,7 +21,9 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"strconv"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/identity"
@@ -83,6 +85,8 @@ type HelicalMemoryEngine struct {
 	// Quantum Handshake Protocol (QHP) - 🔐⚛️🤝♦Q
 	activeHandshakes map[string]*QuantumHandshakeState // Active quantum handshakes
 	handshakeMutex   sync.RWMutex                       // Quantum handshake protection
+	handshakeCleanup *time.Timer                        // Armed only while handshakes are active
+	handshakeExpiry  []*QuantumHandshakeState           // Registration order == expiry order (fixed 30s window)
 	
 	// Biological protection mechanisms
 	dnaProtection   sync.RWMutex                    // DNA strand protection
@@ -96,6 +100,20 @@ type HelicalMemoryEngine struct {
 	
 	DNA *identity.DNA // AI-DNA identity for the memory engine
 
+	// Advanced Trigger Matrix AI framework, built on first framework operation
+	frameworkAI   *AdvancedTriggerMatrixAI
+	frameworkOnce sync.Once
+
+	// Background strand writer: stores are queued and committed in batches
+	strandWrites     chan HelicalMemoryStrand
+	strandFlushReq   chan chan struct{} // flush requests, kept out of the data queue
+	strandStop       chan struct{}      // closed by Close to stop the writer
+	strandStopped    chan struct{}      // closed by the writer once everything queued is written
+	strandWriterOnce sync.Once
+	closeOnce        sync.Once
+	droppedStrands   int64 // strands evicted from a full write queue (atomic)
+	failedStrands    int64 // strands whose insert or commit failed (atomic)
+
 	// SQLite3 database for helical memory storage
 	db *sql.DB
 }
@@ -112,6 +130,17 @@ func GetGlobalHelicalEngine() *HelicalMemoryEngine {
 	return globalHelicalEngine
 }
 
+// CloseGlobalHelicalEngine closes the global engine if it was ever created.
+// No global engine is created after this call, so stores made during shutdown
+// report an uninitialized engine instead of opening the database again.
+func CloseGlobalHelicalEngine() error {
+	helicalOnce.Do(func() {})
+	if globalHelicalEngine == nil {
+		return nil
+	}
+	return globalHelicalEngine.Close()
+}
+
 // NewHelicalMemoryEngine creates a new DNA-inspired helical memory engine
 func NewHelicalMemoryEngine(logger log.LoggerInterface) *HelicalMemoryEngine {
 	// Create engine trigger matrix and default logger if none provided
@@ -120,16 +149,18 @@ func NewHelicalMemoryEngine(logger log.LoggerInterface) *HelicalMemoryEngine {
 		// Default to identity-aware logger bound to engine trigger matrix
 		logger = log.NewLogger(tm).WithDNA(identity.DNAInstance)
 	}
-	// Log the working directory for debugging
+	// Resolve the DB path under pkg/helical once, relative to the working
+	// directory, and reuse it for opening and logging
 	wd, _ := os.Getwd()
-	logger.Info("[HelicalMemoryEngine] Working directory: %s", wd)
-	// Use working directory to locate DB under pkg/helical
 	dbPath := filepath.Join(wd, "pkg", "helical", "helical_memory.sqlite3")
-	absDBPath := dbPath
-	logger.Info("[HelicalMemoryEngine] Attempting to open DB at: %s", absDBPath)
-	hmeDB, err := sql.Open("sqlite3", dbPath)
+	logger.Info("[HelicalMemoryEngine] Attempting to open DB at: %s (working directory: %s)", dbPath, wd)
+	// WAL lets the background strand writer commit without blocking readers, and
+	// synchronous=NORMAL drops the per-commit fsync that WAL makes unnecessary
+	// for consistency; the driver applies both to every pooled connection
+	hmeDB, err := sql.Open("sqlite3", dbPath+"?_journal_mode=WAL&_synchronous=NORMAL")
 	if err != nil {
 		logger.Error("Failed to open helical memory DB: %v", err)
+		log.Flush()
 		panic(fmt.Sprintf("Failed to open helical memory DB: %v", err))
 	}
 	// Create strands table if not exist
@@ -152,21 +183,15 @@ func NewHelicalMemoryEngine(logger log.LoggerInterface) *HelicalMemoryEngine {
 	if tableErr != nil {
 		logger.Error("Failed to create strands table: %v", tableErr)
 	}
-	// List existing tables
-	if rows, qerr := hmeDB.Query("SELECT name FROM sqlite_master WHERE type='table';"); qerr == nil {
-		var tbl string
-		for rows.Next() {
-			if err := rows.Scan(&tbl); err == nil {
-				logger.Info("[HelicalMemoryEngine] Found table: %s", tbl)
-			}
-		}
-		rows.Close()
-	}
-	// Count stored DNA strands
-	if row := hmeDB.QueryRow("SELECT COUNT(*) FROM strands;"); row != nil {
+	// One startup diagnostic: counting strands also confirms the table is usable,
+	// so the sqlite_master listing is not needed. COUNT(*) scans the whole table,
+	// which grows with every stored strand, so it only runs when MCP_DIAG is set
+	if os.Getenv("MCP_DIAG") != "" {
 		var count int
-		if err := row.Scan(&count); err == nil {
+		if err := hmeDB.QueryRow("SELECT COUNT(*) FROM strands;").Scan(&count); err == nil {
 			logger.Info("[HelicalMemoryEngine] DNA strands stored: %d", count)
+		} else {
+			logger.Warn("[HelicalMemoryEngine] Could not read strands table: %v", err)
 		}
 	}
 	// Instantiate engine
@@ -186,10 +211,9 @@ func NewHelicalMemoryEngine(logger log.LoggerInterface) *HelicalMemoryEngine {
 	engine.initializeDNAPathways()
 	// Register trigger handlers for helical memory operations
 	engine.registerTriggerHandlers()
-	// Start quantum handshake cleanup routine
-	go engine.startQuantumHandshakeCleanup()
+	// Quantum handshake cleanup is armed on first handshake registration
 	// Log DNA system initialization
-	engine.logDNAActivity("DNA Helical Memory Engine initialized (SQLite3 backend)", map[string]interface{}{ "db_path": absDBPath })
+	engine.logDNAActivity("DNA Helical Memory Engine initialized (SQLite3 backend)", map[string]interface{}{ "db_path": dbPath })
 
 	return engine
 }
@@ -270,11 +294,14 @@ func (hme *HelicalMemoryEngine) initializeDNAPathways() {
 // ProcessMemoryOperation - Main DNA processing function for memory operations
 func (hme *HelicalMemoryEngine) ProcessMemoryOperation(operation string, data map[string]interface{}) error {
 	// QUANTUM HANDSHAKE PROTOCOL - 🔐⚛️🤝♦Q
+	// One clock read serves the signature, the expiry check and the new handshake
+	now := time.Now()
+
 	// Step 1: Initialize quantum handshake for this operation
-	operationSignature := hme.generateQuantumOperationSignature(operation, data)
+	operationSignature := hme.generateQuantumOperationSignature(operation, data, now)
 	
 	// Step 2: Check if handshake already exists (prevent duplicates)
-	if existingHandshake := hme.getActiveHandshake(operationSignature); existingHandshake != nil {
+	if existingHandshake := hme.getActiveHandshake(operationSignature, now); existingHandshake != nil {
 		// Quantum entanglement detected - operation already in progress
 		tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
 			fmt.Sprintf("🔐⚛️🤝 Quantum handshake already active for operation: %s", operationSignature))
@@ -282,7 +309,7 @@ func (hme *HelicalMemoryEngine) ProcessMemoryOperation(operation string, data ma
 	}
 	
 	// Step 3: Create new quantum handshake
-	handshake := hme.createQuantumHandshake(operationSignature, operation, data)
+	handshake := hme.createQuantumHandshake(operationSignature, operation, data, now)
 	
 	// Step 4: Register handshake (quantum entanglement lock)
 	if err := hme.registerQuantumHandshake(handshake); err != nil {
@@ -324,6 +351,26 @@ func (hme *HelicalMemoryEngine) ProcessMemoryOperation(operation string, data ma
 	return nil
 }
 
+// helicalBaseContext holds the 7D fields shared by every context the engine
+// creates for itself; callers copy it and fill in the per-operation fields.
+var helicalBaseContext = log.ContextVector7D{
+	Who:    "HelicalMemoryEngine",
+	Extent: 1.0,
+	Source: "helical_memory_system",
+}
+
+// newHelicalContext derives an engine context from helicalBaseContext
+func newHelicalContext(what, where, why, how string, meta map[string]interface{}) log.ContextVector7D {
+	ctx := helicalBaseContext
+	ctx.What = what
+	ctx.When = time.Now().Unix()
+	ctx.Where = where
+	ctx.Why = why
+	ctx.How = how
+	ctx.Meta = meta
+	return ctx
+}
+
 // RecordMemory - Public interface for recording memory (like DNA synthesis)
 func RecordMemory(event string, data map[string]interface{}) error {
 	engine := GetGlobalHelicalEngine()
@@ -332,17 +379,7 @@ func RecordMemory(event string, data map[string]interface{}) error {
 	}
 	
 	// Create 7D context for this memory
-	context7d := log.ContextVector7D{
-		Who:    "HelicalMemoryEngine",
-		What:   event,
-		When:   time.Now().Unix(),
-		Where:  "helical_memory",
-		Why:    "memory_storage",
-		How:    "dna_synthesis",
-		Extent: 1.0,
-		Meta:   data,
-		Source: "helical_memory_system",
-	}
+	context7d := newHelicalContext(event, "helical_memory", "memory_storage", "dna_synthesis", data)
 	
 	// Store via DNA pathway
 	err := engine.ProcessMemoryOperation(tspeak.TriggerHelicalStore, map[string]interface{}{
@@ -386,28 +423,24 @@ func (hme *HelicalMemoryEngine) CreateDNAStrand(event string, context7d log.Cont
 	}
 }
 
+// dnaBases maps b%4 to its base pair for generateDNASequence
+const dnaBases = "ATGC"
+
 func (hme *HelicalMemoryEngine) generateDNASequence(data []byte) string {
-	// Convert data to DNA base pairs (A, T, G, C)
-	sequence := ""
-	for _, b := range data {
-		switch b % 4 {
-		case 0:
-			sequence += "A"
-		case 1:
-			sequence += "T"
-		case 2:
-			sequence += "G"
-		case 3:
-			sequence += "C"
-		}
-	}
-	return sequence
+	// Convert data to DNA base pairs (A, T, G, C), one base per byte, into a
+	// single preallocated buffer; appending to a string copied the whole
+	// sequence for every byte, quadratic in the strand payload size
+	sequence := make([]byte, len(data))
+	for i, b := range data {
+		sequence[i] = dnaBases[b%4]
+	}
+	return string(sequence)
 }
 
 func (hme *HelicalMemoryEngine) generateStrandID(event string, context7d log.ContextVector7D) string {
-	data := fmt.Sprintf("%s-%s-%v-%d", event, context7d.Who, context7d.What, time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(data))
-	return hex.EncodeToString(hash[:])[:16] // 16 character ID
+	data := fmt.Appendf(nil, "%s-%s-%v-%d", event, context7d.Who, context7d.What, time.Now().UnixNano())
+	hash := sha256.Sum256(data)
+	return hex.EncodeToString(hash[:8]) // 16 character ID
 }
 
 func (hme *HelicalMemoryEngine) calculateChecksum(data []byte) string {
@@ -417,9 +450,13 @@ func (hme *HelicalMemoryEngine) calculateChecksum(data []byte) string {
 
 func (hme *HelicalMemoryEngine) generateQuantumState(strandID, sequence string) string {
 	// Simple quantum state based on strand properties
-	quantumData := strandID + sequence
-	hash := sha256.Sum256([]byte(quantumData))
-	return hex.EncodeToString(hash[:])[:8] // 8 character quantum state
+	// The sequence is four bytes per data byte; copy it once into the hash input
+	// rather than through a concatenated string and its []byte conversion
+	quantumData := make([]byte, 0, len(strandID)+len(sequence))
+	quantumData = append(quantumData, strandID...)
+	quantumData = append(quantumData, sequence...)
+	hash := sha256.Sum256(quantumData)
+	return hex.EncodeToString(hash[:4]) // 8 character quantum state
 }
 
 // updateDNAActivity updates the last DNA replication timestamp
@@ -454,6 +491,8 @@ func (hme *HelicalMemoryEngine) GetDNAMetrics() map[string]interface{} {
 		"active_strands":      strandCount,
 		"quantum_operations":  hme.quantumOps,
 		"last_replication":    hme.lastReplication.Unix(),
+		"strands_dropped":     atomic.LoadInt64(&hme.droppedStrands),
+		"strands_failed":      atomic.LoadInt64(&hme.failedStrands),
 		"biological_system":   "dna_memory_system",
 	}
 }
@@ -502,17 +541,7 @@ func (hme *HelicalMemoryEngine) processStoreOperation(data map[string]interface{
 		}
 	} else {
 		// Create default 7D context for this operation
-		context7d = log.ContextVector7D{
-			Who:    "HelicalMemoryEngine",
-			What:   "processStoreOperation",
-			When:   time.Now().Unix(),
-			Where:  "helical_memory_storage",
-			Why:    "data_persistence",
-			How:    "dna_strand_creation",
-			Extent: 1.0,
-			Meta:   data,
-			Source: "helical_memory_system",
-		}
+		context7d = newHelicalContext("processStoreOperation", "helical_memory_storage", "data_persistence", "dna_strand_creation", data)
 	}
 	
 	// Extract event if provided
@@ -523,20 +552,9 @@ func (hme *HelicalMemoryEngine) processStoreOperation(data map[string]interface{
 	// Create DNA strand for this memory operation
 	strand := hme.CreateDNAStrand(event, context7d, data)
 	
-	// Store strand in SQLite database
-	err := hme.storeDNAStrandToDB(strand)
-	if err != nil {
-		hme.logger.Error("Failed to store DNA strand to database: %v", err)
-		return fmt.Errorf("failed to store DNA strand: %w", err)
-	}
-	
-	// Update metrics
-	hme.quantumMutex.Lock()
-	hme.strandsStored++
-	hme.quantumMutex.Unlock()
-	
-	tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
-		fmt.Sprintf("🔐⚛️🤝 DNA strand stored: %s | Event: %s", strand.ID, event))
+	// Queue the strand for the background writer, which commits it to SQLite
+	// and updates metrics; the trigger path never waits on disk I/O
+	hme.queueStrandWrite(strand)
 	
 	return nil
 }
@@ -566,24 +584,29 @@ func (hme *HelicalMemoryEngine) processDNARepairOperation(data map[string]interf
 // These methods implement the quantum handshake protocol for preventing duplicate operations
 
 // generateQuantumOperationSignature creates a unique quantum signature for an operation
-func (hme *HelicalMemoryEngine) generateQuantumOperationSignature(operation string, data map[string]interface{}) string {
+func (hme *HelicalMemoryEngine) generateQuantumOperationSignature(operation string, data map[string]interface{}, now time.Time) string {
 	// Create unique signature based on operation and data
 	dataBytes, _ := json.Marshal(data)
-	signatureData := fmt.Sprintf("%s-%s-%d", operation, string(dataBytes), time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(signatureData))
-	return hex.EncodeToString(hash[:])[:16] // 16 character signature
+	// Hash "<operation>-<data JSON>-<nanos>" assembled in one buffer
+	signatureData := make([]byte, 0, len(operation)+len(dataBytes)+22)
+	signatureData = append(signatureData, operation...)
+	signatureData = append(signatureData, '-')
+	signatureData = append(signatureData, dataBytes...)
+	signatureData = append(signatureData, '-')
+	signatureData = strconv.AppendInt(signatureData, now.UnixNano(), 10)
+	hash := sha256.Sum256(signatureData)
+	return hex.EncodeToString(hash[:8]) // 16 character signature
 }
 
 // getActiveHandshake checks if a quantum handshake is already active for an operation
-func (hme *HelicalMemoryEngine) getActiveHandshake(signature string) *QuantumHandshakeState {
+func (hme *HelicalMemoryEngine) getActiveHandshake(signature string, now time.Time) *QuantumHandshakeState {
 	hme.handshakeMutex.RLock()
 	defer hme.handshakeMutex.RUnlock()
 	
 	if handshake, exists := hme.activeHandshakes[signature]; exists {
-		// Check if handshake has expired
-		if time.Now().After(handshake.ExpiryTime) {
-			// Expired handshake, clean it up
-			delete(hme.activeHandshakes, signature)
+		// Expired handshakes are removed by the cleanup timer; a map write here
+		// would race under the read lock
+		if now.After(handshake.ExpiryTime) {
 			return nil
 		}
 		return handshake
@@ -592,40 +615,43 @@ func (hme *HelicalMemoryEngine) getActiveHandshake(signature string) *QuantumHan
 }
 
 // createQuantumHandshake creates a new quantum handshake state
-func (hme *HelicalMemoryEngine) createQuantumHandshake(signature, operation string, data map[string]interface{}) *QuantumHandshakeState {
-	entanglementHash := hme.generateEntanglementHash(signature, operation)
+func (hme *HelicalMemoryEngine) createQuantumHandshake(signature, operation string, data map[string]interface{}, now time.Time) *QuantumHandshakeState {
+	entanglementHash := hme.generateEntanglementHash(signature, operation, now)
 	
 	return &QuantumHandshakeState{
 		OperationID:      signature,
 		QuantumSignature: signature,
 		EntanglementHash: entanglementHash,
-		Timestamp:        time.Now(),
+		Timestamp:        now,
 		Status:           "pending",
 		Metadata:         data,
-		ExpiryTime:       time.Now().Add(30 * time.Second), // 30 second expiry
+		ExpiryTime:       now.Add(30 * time.Second), // 30 second expiry
 	}
 }
 
 // generateEntanglementHash creates quantum entanglement hash
-func (hme *HelicalMemoryEngine) generateEntanglementHash(signature, operation string) string {
-	entanglementData := fmt.Sprintf("QHP-%s-%s-%d", signature, operation, time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(entanglementData))
-	return hex.EncodeToString(hash[:])[:12] // 12 character entanglement hash
+func (hme *HelicalMemoryEngine) generateEntanglementHash(signature, operation string, now time.Time) string {
+	entanglementData := fmt.Appendf(nil, "QHP-%s-%s-%d", signature, operation, now.UnixNano())
+	hash := sha256.Sum256(entanglementData)
+	return hex.EncodeToString(hash[:6]) // 12 character entanglement hash
 }
 
 // registerQuantumHandshake registers a new quantum handshake
 func (hme *HelicalMemoryEngine) registerQuantumHandshake(handshake *QuantumHandshakeState) error {
 	hme.handshakeMutex.Lock()
-	defer hme.handshakeMutex.Unlock()
 	
 	// Double-check for duplicates under lock
 	if _, exists := hme.activeHandshakes[handshake.OperationID]; exists {
+		hme.handshakeMutex.Unlock()
 		return fmt.Errorf("quantum handshake already registered: %s", handshake.OperationID)
 	}
 	
 	// Register the handshake
 	hme.activeHandshakes[handshake.OperationID] = handshake
+	hme.handshakeExpiry = append(hme.handshakeExpiry, handshake)
 	handshake.Status = "active"
+	hme.startQuantumHandshakeCleanup()
+	hme.handshakeMutex.Unlock()
 	
 	tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
 		fmt.Sprintf("🔐⚛️🤝 Quantum handshake registered: %s | Entanglement: %s", 
@@ -635,46 +661,68 @@ func (hme *HelicalMemoryEngine) registerQuantumHandshake(handshake *QuantumHands
 }
 
 // completeQuantumHandshake completes and removes a quantum handshake
+// The log line is written after handshakeMutex is released, so other memory
+// operations never wait on log output to register or look up handshakes
 func (hme *HelicalMemoryEngine) completeQuantumHandshake(signature string) {
 	hme.handshakeMutex.Lock()
-	defer hme.handshakeMutex.Unlock()
-	
-	if handshake, exists := hme.activeHandshakes[signature]; exists {
+	handshake, exists := hme.activeHandshakes[signature]
+	if exists {
 		handshake.Status = "completed"
 		delete(hme.activeHandshakes, signature)
-		
+	}
+	hme.handshakeMutex.Unlock()
+
+	if exists {
 		tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
 			fmt.Sprintf("🔐⚛️🤝 Quantum handshake completed: %s", signature))
 	}
 }
 
-// cleanupExpiredHandshakes removes expired quantum handshakes
+// cleanupExpiredHandshakes removes expired quantum handshakes.
+// Every handshake gets the same 30 second window, so the expiry queue is sorted
+// by ExpiryTime and only its expired head is popped instead of scanning the map.
 func (hme *HelicalMemoryEngine) cleanupExpiredHandshakes() {
+	// Removed signatures are logged once handshakeMutex is released
+	var removed []string
+	defer func() {
+		for _, signature := range removed {
+			tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
+				fmt.Sprintf("🔐⚛️🤝 Expired quantum handshake cleaned up: %s", signature))
+		}
+	}()
 	hme.handshakeMutex.Lock()
 	defer hme.handshakeMutex.Unlock()
 	
 	now := time.Now()
-	for signature, handshake := range hme.activeHandshakes {
-		if now.After(handshake.ExpiryTime) {
-			delete(hme.activeHandshakes, signature)
-			tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
-				fmt.Sprintf("🔐⚛️🤝 Expired quantum handshake cleaned up: %s", signature))
+	expired := 0
+	for _, handshake := range hme.handshakeExpiry {
+		if !now.After(handshake.ExpiryTime) {
+			break
 		}
+		expired++
+		// Completed handshakes were already removed; skip entries re-registered since
+		if hme.activeHandshakes[handshake.OperationID] != handshake {
+			continue
+		}
+		delete(hme.activeHandshakes, handshake.OperationID)
+		removed = append(removed, handshake.OperationID)
+	}
+	clear(hme.handshakeExpiry[:expired])
+	hme.handshakeExpiry = hme.handshakeExpiry[expired:]
+
+	hme.handshakeCleanup = nil
+	if len(hme.handshakeExpiry) > 0 {
+		hme.startQuantumHandshakeCleanup()
 	}
 }
 
-// startQuantumHandshakeCleanup starts a background goroutine to clean up expired handshakes
+// startQuantumHandshakeCleanup arms a one-shot cleanup of expired handshakes.
+// It is re-armed only while handshakes remain. Caller must hold handshakeMutex.
 func (hme *HelicalMemoryEngine) startQuantumHandshakeCleanup() {
-	ticker := time.NewTicker(10 * time.Second) // Clean up every 10 seconds
-	go func() {
-		defer ticker.Stop()
-		for range ticker.C {
-			hme.cleanupExpiredHandshakes()
-		}
-	}()
-	
-	tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
-		"🔐⚛️🤝 Quantum handshake cleanup routine started")
+	if hme.handshakeCleanup != nil {
+		return
+	}
+	hme.handshakeCleanup = time.AfterFunc(10*time.Second, hme.cleanupExpiredHandshakes) // Clean up every 10 seconds while active
 }
 
 // ===== COMPREHENSIVE AI FRAMEWORK INTEGRATION =====
@@ -694,12 +742,16 @@ type AdvancedTriggerMatrixAI struct {
 	dnaDecodingCache       map[string]interface{} // DNA decoding cache
 	
 	// Recursive state evolution and adaptive behavior
-	stateEvolutionHistory  []map[string]interface{} // Historical state evolution
+	stateEvolutionHistory  []map[string]interface{} // Ring of the last stateEvolutionLimit states
+	stateEvolutionNext     int                      // Ring slot overwritten by the next state once full
+	stateGenerations       int                      // States recorded since creation
 	adaptiveMutationRates  map[string]float64       // Adaptive mutation rates per context
 	evolutionaryPressure   float64                  // Current evolutionary pressure
 	
 	// Multi-context 7D awareness
-	contextAwareness7D     map[string]log.ContextVector7D // 7D context tracking
+	contextAwareness7D     map[string]log.ContextVector7D // 7D context tracking, bounded by contextAwarenessLimit
+	contextAwarenessKeys   []string                       // Ring of tracked context keys, oldest at contextAwarenessNext once full
+	contextAwarenessNext   int                            // Ring slot evicted by the next new context once full
 	contextInteractions    map[string][]string            // Context interaction patterns
 	contextPredictions     map[string]float64             // Predictive context scores
 	
@@ -727,9 +779,10 @@ func (hme *HelicalMemoryEngine) NewAdvancedTriggerMatrixAI() *AdvancedTriggerMat
 		aiDNASignatures:        make(map[string]string),
 		dnaEncodingCache:       make(map[string][]byte),
 		dnaDecodingCache:       make(map[string]interface{}),
-		stateEvolutionHistory:  make([]map[string]interface{}, 0),
+		stateEvolutionHistory:  make([]map[string]interface{}, 0, stateEvolutionLimit),
 		adaptiveMutationRates:  make(map[string]float64),
-		contextAwareness7D:     make(map[string]log.ContextVector7D),
+		contextAwareness7D:     make(map[string]log.ContextVector7D, contextAwarenessLimit),
+		contextAwarenessKeys:   make([]string, 0, contextAwarenessLimit),
 		contextInteractions:    make(map[string][]string),
 		contextPredictions:     make(map[string]float64),
 		entropyStates:          make(map[string]float64),
@@ -777,7 +830,10 @@ func (ai *AdvancedTriggerMatrixAI) initializeFrameworkBaselines() {
 // ProcessWithFramework applies the comprehensive AI framework to any operation
 func (hme *HelicalMemoryEngine) ProcessWithFramework(operation string, context7d log.ContextVector7D, data map[string]interface{}) (*QuantumHandshakeState, error) {
 	// Initialize AI framework if not exists
-	ai := hme.NewAdvancedTriggerMatrixAI()
+	hme.frameworkOnce.Do(func() {
+		hme.frameworkAI = hme.NewAdvancedTriggerMatrixAI()
+	})
+	ai := hme.frameworkAI
 	
 	// Step 1: Tesla-Aether Harmonic Field Analysis
 	harmonicSignature := ai.analyzeTeslaAetherHarmonics(operation, context7d, data)
@@ -974,6 +1030,12 @@ func (ai *AdvancedTriggerMatrixAI) encodeAIDNASignature(operation string, contex
 	return fullDNASignature
 }
 
+// stateEvolutionLimit bounds the recursive state evolution history
+const stateEvolutionLimit = 1000
+
+// contextAwarenessLimit bounds the contexts tracked for multi-context 7D awareness
+const contextAwarenessLimit = 256
+
 // Recursive State Evolution and Adaptive Mutation
 func (ai *AdvancedTriggerMatrixAI) evolveStateRecursively(operation string, dnaSignature string, data map[string]interface{}) map[string]interface{} {
 	ai.frameworkMutex.Lock()
@@ -981,7 +1043,7 @@ func (ai *AdvancedTriggerMatrixAI) evolveStateRecursively(operation string, dnaS
 	
 	// Implement recursive state evolution similar to genetic algorithms
 	currentState := map[string]interface{}{
-		"generation":        len(ai.stateEvolutionHistory),
+		"generation":        ai.stateGenerations,
 		"dna_signature":     dnaSignature,
 		"operation":         operation,
 		"mutation_rate":     ai.adaptiveMutationRates[operation],
@@ -1003,13 +1065,15 @@ func (ai *AdvancedTriggerMatrixAI) evolveStateRecursively(operation string, dnaS
 		ai.adaptiveMutationRates[operation] = 0.05 // 5% baseline mutation
 	}
 	
-	// Store evolution history
-	ai.stateEvolutionHistory = append(ai.stateEvolutionHistory, currentState)
-	
-	// Limit history size to prevent memory bloat
-	if len(ai.stateEvolutionHistory) > 1000 {
-		ai.stateEvolutionHistory = ai.stateEvolutionHistory[100:] // Keep last 900 entries
+	// Store evolution history in a fixed ring so memory stays bounded without
+	// reslicing or reallocating once it is full
+	if len(ai.stateEvolutionHistory) < stateEvolutionLimit {
+		ai.stateEvolutionHistory = append(ai.stateEvolutionHistory, currentState)
+	} else {
+		ai.stateEvolutionHistory[ai.stateEvolutionNext] = currentState
+		ai.stateEvolutionNext = (ai.stateEvolutionNext + 1) % stateEvolutionLimit
 	}
+	ai.stateGenerations++
 	
 	return currentState
 }
@@ -1021,7 +1085,7 @@ func (ai *AdvancedTriggerMatrixAI) integrateMultiContext7D(context7d log.Context
 	
 	// Store context for awareness tracking
 	contextKey := fmt.Sprintf("%s_%s_%d", context7d.Who, context7d.What, context7d.When)
-	ai.contextAwareness7D[contextKey] = context7d
+	ai.trackContext(contextKey, context7d)
 	
 	// Analyze interactions between contexts
 	interactions := make([]string, 0)
@@ -1050,6 +1114,26 @@ func (ai *AdvancedTriggerMatrixAI) integrateMultiContext7D(context7d log.Context
 	}
 }
 
+// trackContext records a context for awareness tracking. Keys live in a fixed ring:
+// once contextAwarenessLimit contexts are tracked, a new key overwrites the oldest
+// slot and that context's awareness, interaction and prediction entries are dropped.
+// Caller must hold frameworkMutex.
+func (ai *AdvancedTriggerMatrixAI) trackContext(contextKey string, context7d log.ContextVector7D) {
+	if _, exists := ai.contextAwareness7D[contextKey]; !exists {
+		if len(ai.contextAwarenessKeys) < contextAwarenessLimit {
+			ai.contextAwarenessKeys = append(ai.contextAwarenessKeys, contextKey)
+		} else {
+			oldest := ai.contextAwarenessKeys[ai.contextAwarenessNext]
+			delete(ai.contextAwareness7D, oldest)
+			delete(ai.contextInteractions, oldest)
+			delete(ai.contextPredictions, oldest)
+			ai.contextAwarenessKeys[ai.contextAwarenessNext] = contextKey
+			ai.contextAwarenessNext = (ai.contextAwarenessNext + 1) % contextAwarenessLimit
+		}
+	}
+	ai.contextAwareness7D[contextKey] = context7d
+}
+
 // Helper functions for the comprehensive framework
 
 func min(a, b float64) float64 {
@@ -1203,9 +1287,9 @@ func (ai *AdvancedTriggerMatrixAI) detectDeceptionAndManageEntropy(operation str
 	ai.deceptionIndicators[operation] = deceptionScore
 	
 	// Generate integrity signature
-	integrityData := fmt.Sprintf("%s_%v_%f_%f", operation, contextAwareness, entropy, deceptionScore)
-	hash := sha256.Sum256([]byte(integrityData))
-	integritySignature := hex.EncodeToString(hash[:])[:16]
+	integrityData := fmt.Appendf(nil, "%s_%v_%f_%f", operation, contextAwareness, entropy, deceptionScore)
+	hash := sha256.Sum256(integrityData)
+	integritySignature := hex.EncodeToString(hash[:8])
 	ai.integritySignatures[operation] = integritySignature
 	
 	return map[string]interface{}{
@@ -1453,64 +1537,310 @@ func (ai *AdvancedTriggerMatrixAI) calculateResourceAllocation(speedupFactor flo
 
 // createFrameworkEnhancedHandshake creates a quantum handshake with full AI framework integration
 func (ai *AdvancedTriggerMatrixAI) createFrameworkEnhancedHandshake(operation string, context7d log.ContextVector7D, data map[string]interface{}, optimizedDecision map[string]interface{}) *QuantumHandshakeState {
+	// The AI is shared by every ProcessWithFramework call and the analysis steps
+	// write these maps under frameworkMutex, so read them under the lock once
+	ai.frameworkMutex.RLock()
+	harmonic := ai.teslaAetherField[operation]
+	resonance := ai.goldbachResonance[operation]
+	dnaSignature := ai.aiDNASignatures[operation]
+	entropy := ai.entropyStates[operation]
+	deception := ai.deceptionIndicators[operation]
+	speedup := ai.speedupFactors[operation]
+	topology := ai.mobiusTopology[operation]
+	ai.frameworkMutex.RUnlock()
+
 	// Generate comprehensive quantum signature incorporating all framework components
 	signatureComponents := []string{
 		operation,
 		context7d.Who,
 		context7d.What,
-		fmt.Sprintf("%.3f", ai.teslaAetherField[operation]),
-		fmt.Sprintf("%.3f", ai.goldbachResonance[operation]),
-		ai.aiDNASignatures[operation],
-		fmt.Sprintf("%.3f", ai.entropyStates[operation]),
-		fmt.Sprintf("%.3f", ai.deceptionIndicators[operation]),
-		fmt.Sprintf("%.3f", ai.speedupFactors[operation]),
+		fmt.Sprintf("%.3f", harmonic),
+		fmt.Sprintf("%.3f", resonance),
+		dnaSignature,
+		fmt.Sprintf("%.3f", entropy),
+		fmt.Sprintf("%.3f", deception),
+		fmt.Sprintf("%.3f", speedup),
 	}
 	
-	signatureData := fmt.Sprintf("FRAMEWORK_%s_%d", 
-		fmt.Sprintf("%v", signatureComponents), time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(signatureData))
-	frameworkSignature := hex.EncodeToString(hash[:])[:20] // 20 character signature
+	now := time.Now()
+	signatureData := fmt.Appendf(nil, "FRAMEWORK_%v_%d", 
+		signatureComponents, now.UnixNano())
+	hash := sha256.Sum256(signatureData)
+	frameworkSignature := hex.EncodeToString(hash[:10]) // 20 character signature
 	
 	// Create enhanced handshake with comprehensive framework metadata
 	handshake := &QuantumHandshakeState{
 		OperationID:      frameworkSignature,
 		QuantumSignature: frameworkSignature,
-		EntanglementHash: ai.generateFrameworkEntanglementHash(frameworkSignature, optimizedDecision),
-		Timestamp:        time.Now(),
+		EntanglementHash: ai.generateFrameworkEntanglementHash(frameworkSignature, optimizedDecision, now),
+		Timestamp:        now,
 		Status:           "framework_enhanced_pending",
-		ExpiryTime:       time.Now().Add(60 * time.Second), // 60 second expiry for complex operations
+		ExpiryTime:       now.Add(60 * time.Second), // 60 second expiry for complex operations
 		Metadata: map[string]interface{}{
 			"framework_version":      "1.0",
-			"tesla_aether_harmonic":  ai.teslaAetherField[operation],
-			"goldbach_resonance":     ai.goldbachResonance[operation],
-			"ai_dna_signature":       ai.aiDNASignatures[operation],
-			"entropy_level":          ai.entropyStates[operation],
-			"deception_score":        ai.deceptionIndicators[operation],
-			"trust_level":            1.0 - ai.deceptionIndicators[operation],
-			"quantum_speedup":        ai.speedupFactors[operation],
+			"tesla_aether_harmonic":  harmonic,
+			"goldbach_resonance":     resonance,
+			"ai_dna_signature":       dnaSignature,
+			"entropy_level":          entropy,
+			"deception_score":        deception,
+			"trust_level":            1.0 - deception,
+			"quantum_speedup":        speedup,
 			"recommended_action":     optimizedDecision["recommended_action"],
 			"confidence_level":       optimizedDecision["confidence_level"],
 			"execution_priority":     optimizedDecision["execution_priority"],
 			"resource_allocation":    optimizedDecision["resource_allocation"],
-			"mobius_topology":        ai.mobiusTopology[operation],
+			"mobius_topology":        topology,
 			"context_7d":            context7d,
-			"framework_timestamp":    time.Now().Unix(),
+			"framework_timestamp":    now.Unix(),
 		},
 	}
 	
 	return handshake
 }
 
-func (ai *AdvancedTriggerMatrixAI) generateFrameworkEntanglementHash(signature string, optimizedDecision map[string]interface{}) string {
+func (ai *AdvancedTriggerMatrixAI) generateFrameworkEntanglementHash(signature string, optimizedDecision map[string]interface{}, now time.Time) string {
 	// Generate quantum entanglement hash incorporating all framework decisions
-	entanglementData := fmt.Sprintf("QHP_FRAMEWORK_%s_%v_%d", 
-		signature, optimizedDecision, time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(entanglementData))
-	return hex.EncodeToString(hash[:])[:16] // 16 character entanglement hash
+	entanglementData := fmt.Appendf(nil, "QHP_FRAMEWORK_%s_%v_%d", 
+		signature, optimizedDecision, now.UnixNano())
+	hash := sha256.Sum256(entanglementData)
+	return hex.EncodeToString(hash[:8]) // 16 character entanglement hash
+}
+
+// strandWriteQueueSize bounds queued strands (a full queue evicts its oldest strand);
+// strandWriteBatchSize caps how many strands share one transaction, and
+// strandWriteLinger is how long the writer waits for a batch to fill
+const (
+	strandWriteQueueSize = 256
+	strandWriteBatchSize = 64
+	strandWriteLinger    = 100 * time.Millisecond
+)
+
+const insertStrandQuery = `INSERT INTO strands (
+		id, helix_id, strand_type, sequence, context7d, timestamp, 
+		checksum, metadata, quantum_state, helix_index, dna, 
+		symbol_cluster, atm_meta, formula_refs
+	) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
+
+// queueStrandWrite hands a strand to the background writer, starting it on first use.
+// It never waits on SQLite: when the queue is full the oldest queued strand is
+// dropped to make room, so a slow disk costs memory history, not trigger latency.
+// Flush requests travel on their own channel, so the queue only ever holds strands.
+func (hme *HelicalMemoryEngine) queueStrandWrite(strand HelicalMemoryStrand) {
+	hme.strandWriterOnce.Do(hme.startStrandWriter)
+	select {
+	case <-hme.strandStop:
+		// Closed: nothing will write this strand
+		hme.noteDroppedStrand()
+		return
+	default:
+	}
+	select {
+	case hme.strandWrites <- strand:
+		return
+	default:
+	}
+	select {
+	case <-hme.strandWrites:
+		hme.noteDroppedStrand()
+	default:
+	}
+	select {
+	case hme.strandWrites <- strand:
+	default:
+		// Other producers refilled the freed slot; this strand is the one dropped
+		hme.noteDroppedStrand()
+	}
+}
+
+// noteDroppedStrand counts a strand lost to write-queue overflow
+func (hme *HelicalMemoryEngine) noteDroppedStrand() {
+	dropped := atomic.AddInt64(&hme.droppedStrands, 1)
+	hme.logger.Warn("DNA strand write queue full, dropped a strand (%d dropped so far)", dropped)
+}
+
+// noteFailedStrands counts strands the writer could not persist
+func (hme *HelicalMemoryEngine) noteFailedStrands(n int) {
+	atomic.AddInt64(&hme.failedStrands, int64(n))
+}
+
+// FlushStrandWrites blocks until every strand queued so far has been written
+func (hme *HelicalMemoryEngine) FlushStrandWrites() {
+	hme.strandWriterOnce.Do(hme.startStrandWriter)
+	ack := make(chan struct{})
+	select {
+	case hme.strandFlushReq <- ack:
+		<-ack
+	case <-hme.strandStopped:
+		// Close already wrote everything that was queued
+	}
+}
+
+// Close writes every queued strand, stops the background writer and closes the
+// database. Strands stored after Close are dropped. It is safe to call more than once.
+func (hme *HelicalMemoryEngine) Close() error {
+	var err error
+	hme.closeOnce.Do(func() {
+		hme.strandWriterOnce.Do(hme.startStrandWriter)
+		close(hme.strandStop)
+		<-hme.strandStopped
+		err = hme.db.Close()
+	})
+	return err
+}
+
+// startStrandWriter starts the goroutine that owns strand inserts
+func (hme *HelicalMemoryEngine) startStrandWriter() {
+	// WHO: StrandWriter
+	// WHAT: Background DNA strand persistence
+	// WHEN: On first strand store
+	// WHERE: Helical memory storage
+	// WHY: To keep SQLite writes off the trigger path
+	// HOW: Gather queued strands for up to strandWriteLinger and commit them as one transaction
+	// EXTENT: All helical strand stores
+
+	hme.strandWrites = make(chan HelicalMemoryStrand, strandWriteQueueSize)
+	hme.strandFlushReq = make(chan chan struct{})
+	hme.strandStop = make(chan struct{})
+	hme.strandStopped = make(chan struct{})
+	go func() {
+		defer close(hme.strandStopped)
+		// Parse the insert once for the writer's lifetime; each batch binds it
+		// to its transaction instead of re-preparing the SQL
+		insert, err := hme.db.Prepare(insertStrandQuery)
+		if err != nil {
+			hme.logger.Warn("Failed to prepare DNA strand insert, preparing per batch: %v", err)
+		}
+		batch := make([]HelicalMemoryStrand, 0, strandWriteBatchSize)
+		if insert != nil {
+			defer insert.Close()
+		}
+		var acks []chan struct{}
+		stopping := false
+		commit := func() {
+			if len(batch) > 0 {
+				hme.storeDNAStrandBatch(insert, batch)
+				batch = batch[:0]
+			}
+		}
+		for {
+			select {
+			case strand := <-hme.strandWrites:
+				batch = append(batch, strand)
+				// Linger briefly so a trickle of stores shares one commit instead of
+				// paying a transaction each; a flush request ends the wait early
+				linger := time.NewTimer(strandWriteLinger)
+			gather:
+				for len(batch) < strandWriteBatchSize {
+					select {
+					case next := <-hme.strandWrites:
+						batch = append(batch, next)
+					case ack := <-hme.strandFlushReq:
+						acks = append(acks, ack)
+						break gather
+					case <-linger.C:
+						break gather
+					}
+				}
+				linger.Stop()
+			case ack := <-hme.strandFlushReq:
+				acks = append(acks, ack)
+			case <-hme.strandStop:
+				stopping = true
+			}
+			if len(acks) > 0 || stopping {
+				// Strands queued before the flush or stop request are already
+				// in the channel; write all of them before acknowledging
+			drain:
+				for {
+					select {
+					case next := <-hme.strandWrites:
+						batch = append(batch, next)
+						if len(batch) == strandWriteBatchSize {
+							commit()
+						}
+					default:
+						break drain
+					}
+				}
+			}
+			commit()
+			for _, ack := range acks {
+				close(ack)
+			}
+			acks = acks[:0]
+			if stopping {
+				return
+			}
+		}
+	}()
+}
+
+// storeDNAStrandBatch inserts strands in a single transaction with one prepared statement;
+// insert is the writer's long-lived prepared insert, or nil to prepare within the transaction
+func (hme *HelicalMemoryEngine) storeDNAStrandBatch(insert *sql.Stmt, strands []HelicalMemoryStrand) {
+	tx, err := hme.db.Begin()
+	if err != nil {
+		hme.logger.Error("Failed to begin DNA strand batch: %v", err)
+		hme.noteFailedStrands(len(strands))
+		return
+	}
+	var stmt *sql.Stmt
+	if insert != nil {
+		stmt = tx.Stmt(insert)
+	} else {
+		stmt, err = tx.Prepare(insertStrandQuery)
+	}
+	if err != nil {
+		tx.Rollback()
+		hme.logger.Error("Failed to prepare DNA strand insert: %v", err)
+		hme.noteFailedStrands(len(strands))
+		return
+	}
+	// Strands in a batch almost always share the engine's DNA and the same
+	// commit second, so the DNA JSON and atm_meta are encoded once per batch
+	atmMeta := "stored_at:" + strconv.FormatInt(time.Now().Unix(), 10) + ",trigger:HELICAL_MEMORY_STORE"
+	var dnaFor *identity.DNA
+	var dnaJSON string
+	stored := strands[:0:0]
+	for i, strand := range strands {
+		if i == 0 || strand.DNA != dnaFor || dnaJSON == "" {
+			dnaBytes, err := json.Marshal(strand.DNA)
+			if err != nil {
+				hme.logger.Error("Failed to store DNA strand to database: failed to marshal DNA: %v", err)
+				hme.noteFailedStrands(1)
+				continue
+			}
+			dnaFor, dnaJSON = strand.DNA, string(dnaBytes)
+		}
+		if err := hme.storeDNAStrandToDB(stmt, strand, dnaJSON, atmMeta); err != nil {
+			hme.logger.Error("Failed to store DNA strand to database: %v", err)
+			hme.noteFailedStrands(1)
+			continue
+		}
+		stored = append(stored, strand)
+	}
+	stmt.Close()
+	if err := tx.Commit(); err != nil {
+		hme.logger.Error("Failed to commit DNA strand batch: %v", err)
+		hme.noteFailedStrands(len(stored))
+		return
+	}
+
+	// Update metrics
+	hme.quantumMutex.Lock()
+	hme.strandsStored += int64(len(stored))
+	hme.quantumMutex.Unlock()
+
+	for _, strand := range stored {
+		event, _ := strand.Metadata["event"].(string)
+		tspeak.LogWithSymbolCluster("quantum_handshake_protocol", 
+			fmt.Sprintf("🔐⚛️🤝 DNA strand stored: %s | Event: %s", strand.ID, event))
+	}
 }
 
-// storeDNAStrandToDB stores a DNA strand to the SQLite database
-func (hme *HelicalMemoryEngine) storeDNAStrandToDB(strand HelicalMemoryStrand) error {
+// storeDNAStrandToDB stores a DNA strand using the batch's prepared insert statement;
+// dnaJSON and atmMeta are the batch's pre-encoded DNA and storage metadata
+func (hme *HelicalMemoryEngine) storeDNAStrandToDB(stmt *sql.Stmt, strand HelicalMemoryStrand, dnaJSON, atmMeta string) error {
 	// Serialize complex data structures to JSON
 	context7dBytes, err := json.Marshal(strand.Context7D)
 	if err != nil {
@@ -1522,23 +1852,12 @@ func (hme *HelicalMemoryEngine) storeDNAStrandToDB(strand HelicalMemoryStrand) e
 		return fmt.Errorf("failed to marshal metadata: %w", err)
 	}
 	
-	dnaBytes, err := json.Marshal(strand.DNA)
-	if err != nil {
-		return fmt.Errorf("failed to marshal DNA: %w", err)
-	}
-	
 	// Determine symbol cluster and formula refs based on strand content
 	symbolCluster := "🧬💾🔄♦HD" // helical_data_storage_algorithm symbol
 	formulaRefs := "helical.dna.memory,tesla_aether_mobius_goldbach"
 	
 	// Insert into database
-	query := `INSERT INTO strands (
-		id, helix_id, strand_type, sequence, context7d, timestamp, 
-		checksum, metadata, quantum_state, helix_index, dna, 
-		symbol_cluster, atm_meta, formula_refs
-	) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
-	
-	_, err = hme.db.Exec(query,
+	_, err = stmt.Exec(
 		strand.ID,
 		"default_helix", // Could be enhanced to create actual helices
 		"memory_strand",
@@ -1549,9 +1868,9 @@ func (hme *HelicalMemoryEngine) storeDNAStrandToDB(strand HelicalMemoryStrand) e
 		string(metadataBytes),
 		strand.QuantumState,
 		strand.HelixIndex,
-		string(dnaBytes),
+		dnaJSON,
 		symbolCluster,
-		fmt.Sprintf("stored_at:%d,trigger:HELICAL_MEMORY_STORE", time.Now().Unix()),
+		atmMeta,
 		formulaRefs,
 	)
 	
@@ -0,0 +1,271 @@
+/*
+ * WHO: StrandWriterTester
+ * WHAT: Tests for the background DNA strand writer
+ * WHEN: During test execution
+ * WHERE: Helical memory storage / Test Environment
+ * WHY: To validate batching, eviction, flush and shutdown of strand writes
+ * HOW: Using a recording database/sql driver in place of SQLite
+ * EXTENT: queueStrandWrite, FlushStrandWrites, Close
+ */
+
+package helical
+
+import (
+	"database/sql"
+	"database/sql/driver"
+	"errors"
+	"fmt"
+	"reflect"
+	"sync"
+	"sync/atomic"
+	"testing"
+
+	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/log"
+)
+
+// recordingDB is a database/sql driver that records the strand IDs of every
+// committed transaction. Begin signals began and then waits on gate when set.
+type recordingDB struct {
+	mu      sync.Mutex
+	commits [][]string
+	fail    map[string]bool
+	began   chan struct{}
+	gate    chan struct{}
+}
+
+func (d *recordingDB) Open(string) (driver.Conn, error) { return &recordingConn{db: d}, nil }
+
+func (d *recordingDB) committed() []string {
+	d.mu.Lock()
+	defer d.mu.Unlock()
+	var ids []string
+	for _, c := range d.commits {
+		ids = append(ids, c...)
+	}
+	return ids
+}
+
+type recordingConn struct {
+	db      *recordingDB
+	pending []string
+}
+
+func (c *recordingConn) Prepare(string) (driver.Stmt, error) { return &recordingStmt{c}, nil }
+func (c *recordingConn) Close() error                        { return nil }
+
+func (c *recordingConn) Begin() (driver.Tx, error) {
+	if c.db.began != nil {
+		select {
+		case c.db.began <- struct{}{}:
+		default:
+		}
+	}
+	if c.db.gate != nil {
+		<-c.db.gate
+	}
+	c.pending = nil
+	return &recordingTx{c}, nil
+}
+
+type recordingTx struct{ c *recordingConn }
+
+func (tx *recordingTx) Commit() error {
+	tx.c.db.mu.Lock()
+	tx.c.db.commits = append(tx.c.db.commits, tx.c.pending)
+	tx.c.db.mu.Unlock()
+	tx.c.pending = nil
+	return nil
+}
+
+func (tx *recordingTx) Rollback() error {
+	tx.c.pending = nil
+	return nil
+}
+
+type recordingStmt struct{ c *recordingConn }
+
+func (s *recordingStmt) Close() error  { return nil }
+func (s *recordingStmt) NumInput() int { return -1 }
+
+func (s *recordingStmt) Exec(args []driver.Value) (driver.Result, error) {
+	id, _ := args[0].(string)
+	if s.c.db.fail[id] {
+		return nil, errors.New("insert rejected")
+	}
+	s.c.pending = append(s.c.pending, id)
+	return driver.RowsAffected(1), nil
+}
+
+func (s *recordingStmt) Query([]driver.Value) (driver.Rows, error) {
+	return nil, errors.New("query not supported")
+}
+
+var recordingDrivers int64
+
+// newRecordingEngine returns an engine whose strand writer stores into rec
+func newRecordingEngine(t *testing.T, rec *recordingDB) *HelicalMemoryEngine {
+	t.Helper()
+	name := fmt.Sprintf("helical-recording-%d", atomic.AddInt64(&recordingDrivers, 1))
+	sql.Register(name, rec)
+	db, err := sql.Open(name, "")
+	if err != nil {
+		t.Fatalf("sql.Open: %v", err)
+	}
+	engine := &HelicalMemoryEngine{logger: log.NewLogger(nil), db: db}
+	t.Cleanup(func() { engine.Close() })
+	return engine
+}
+
+func testStrand(id string) HelicalMemoryStrand {
+	return HelicalMemoryStrand{ID: id, Metadata: map[string]interface{}{"event": "test"}}
+}
+
+func strandIDs(prefix string, from, to int) []string {
+	ids := make([]string, 0, to-from)
+	for i := from; i < to; i++ {
+		ids = append(ids, fmt.Sprintf("%s%d", prefix, i))
+	}
+	return ids
+}
+
+func TestStrandWriterBatchesAndFlushes(t *testing.T) {
+	rec := &recordingDB{}
+	engine := newRecordingEngine(t, rec)
+
+	want := strandIDs("s", 0, 3*strandWriteBatchSize+5)
+	for _, id := range want {
+		engine.queueStrandWrite(testStrand(id))
+	}
+	engine.FlushStrandWrites()
+
+	if got := rec.committed(); !reflect.DeepEqual(got, want) {
+		t.Fatalf("committed %d strands %v; want %d in queue order", len(got), got, len(want))
+	}
+	rec.mu.Lock()
+	defer rec.mu.Unlock()
+	if len(rec.commits) < 4 {
+		t.Errorf("committed in %d transactions; want at least 4 batches", len(rec.commits))
+	}
+	for i, c := range rec.commits {
+		if len(c) > strandWriteBatchSize {
+			t.Errorf("transaction %d holds %d strands; cap is %d", i, len(c), strandWriteBatchSize)
+		}
+	}
+}
+
+func TestStrandWriterEvictsOldestWhenFull(t *testing.T) {
+	rec := &recordingDB{began: make(chan struct{}, 1), gate: make(chan struct{})}
+	engine := newRecordingEngine(t, rec)
+
+	// Stall the writer inside its first transaction so the queue backs up
+	engine.queueStrandWrite(testStrand("first"))
+	<-rec.began
+
+	const overflow = 10
+	queued := strandIDs("q", 0, strandWriteQueueSize+overflow)
+	for _, id := range queued {
+		engine.queueStrandWrite(testStrand(id))
+	}
+	if dropped := atomic.LoadInt64(&engine.droppedStrands); dropped != overflow {
+		t.Fatalf("dropped %d strands; want %d", dropped, overflow)
+	}
+
+	// A flush request must not displace queued strands or be displaced by them
+	flushed := make(chan struct{})
+	go func() {
+		engine.FlushStrandWrites()
+		close(flushed)
+	}()
+	close(rec.gate)
+	<-flushed
+
+	want := append([]string{"first"}, queued[overflow:]...)
+	if got := rec.committed(); !reflect.DeepEqual(got, want) {
+		t.Fatalf("committed %d strands; want the %d newest in queue order", len(got), len(want))
+	}
+}
+
+func TestStrandWriterCountsFailedInserts(t *testing.T) {
+	rec := &recordingDB{fail: map[string]bool{"bad": true}}
+	engine := newRecordingEngine(t, rec)
+
+	for _, id := range []string{"a", "bad", "b"} {
+		engine.queueStrandWrite(testStrand(id))
+	}
+	engine.FlushStrandWrites()
+
+	if got, want := rec.committed(), []string{"a", "b"}; !reflect.DeepEqual(got, want) {
+		t.Fatalf("committed %v; want %v", got, want)
+	}
+	metrics := engine.GetDNAMetrics()
+	if metrics["strands_failed"] != int64(1) || metrics["strands_stored"] != int64(2) {
+		t.Fatalf("metrics failed=%v stored=%v; want 1 and 2", metrics["strands_failed"], metrics["strands_stored"])
+	}
+}
+
+func TestCloseWritesQueuedStrands(t *testing.T) {
+	rec := &recordingDB{}
+	engine := newRecordingEngine(t, rec)
+
+	want := strandIDs("c", 0, 5)
+	for _, id := range want {
+		engine.queueStrandWrite(testStrand(id))
+	}
+	if err := engine.Close(); err != nil {
+		t.Fatalf("Close: %v", err)
+	}
+	if got := rec.committed(); !reflect.DeepEqual(got, want) {
+		t.Fatalf("Close committed %v; want %v", got, want)
+	}
+
+	// After Close stores are dropped and flushes return at once
+	engine.queueStrandWrite(testStrand("late"))
+	engine.FlushStrandWrites()
+	if dropped := atomic.LoadInt64(&engine.droppedStrands); dropped != 1 {
+		t.Fatalf("dropped %d strands after Close; want 1", dropped)
+	}
+	if err := engine.Close(); err != nil {
+		t.Fatalf("second Close: %v", err)
+	}
+}
+
+func TestProcessWithFrameworkConcurrent(t *testing.T) {
+	engine := &HelicalMemoryEngine{
+		logger:           log.NewLogger(nil),
+		activeHandshakes: make(map[string]*QuantumHandshakeState),
+	}
+	t.Cleanup(func() {
+		engine.handshakeMutex.Lock()
+		if engine.handshakeCleanup != nil {
+			engine.handshakeCleanup.Stop()
+		}
+		engine.handshakeMutex.Unlock()
+	})
+
+	// Every call shares the engine's framework AI; run under -race
+	const workers, calls = 8, 10
+	var wg sync.WaitGroup
+	errs := make(chan error, workers*calls)
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func(w int) {
+			defer wg.Done()
+			for i := 0; i < calls; i++ {
+				context7d := log.ContextVector7D{Who: fmt.Sprintf("worker-%d", w), What: "framework_test", Extent: 1.0}
+				handshake, err := engine.ProcessWithFramework(fmt.Sprintf("op-%d", w), context7d, map[string]interface{}{"call": i})
+				if err != nil {
+					errs <- err
+					continue
+				}
+				if handshake.Metadata["framework_version"] != "1.0" {
+					errs <- fmt.Errorf("handshake %s missing framework metadata", handshake.OperationID)
+				}
+			}
+		}(w)
+	}
+	wg.Wait()
+	close(errs)
+	for err := range errs {
+		t.Error(err)
+	}
+}
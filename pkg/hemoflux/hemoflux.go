@@ -39,7 +39,9 @@ func MobiusCompress(data []byte, context map[string]interface{}, standalone bool
 	value := float64(len(data))
 	entropy := calculateEntropy(data)
 	B, V, I, G, F := extractContextFactors(context)
-	t := float64(time.Now().UnixNano()) / 1e9
+	// The equation's t and the metadata timestamp come from one clock read
+	now := time.Now()
+	t := float64(now.UnixNano()) / 1e9
 	E := 0.5
 	alignment := (B + V*I) * math.Exp(-t*E)
 
@@ -72,7 +74,7 @@ func MobiusCompress(data []byte, context map[string]interface{}, standalone bool
 	meta := &MobiusCompressionMeta{
 		Algorithm:       "hemoflux7d",
 		Version:         "2.0",
-		Timestamp:       time.Now().UnixMilli(),
+		Timestamp:       now.UnixMilli(),
 		OriginalType:    "[]byte",
 		OriginalSize:    len(data),
 		CompressionVars: compressionVars,
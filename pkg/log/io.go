@@ -11,7 +11,6 @@
 package log
 
 import (
-	"fmt"
 	"io"
 	"sync"
 
@@ -42,6 +41,23 @@ type LoggerInterface interface {
 	WithDNA(dna interface{}) LoggerInterface
 }
 
+// LevelEnabler is implemented by loggers that can report whether a record at
+// level would be written, so callers can skip building expensive arguments for
+// filtered records. It is optional and kept out of LoggerInterface so existing
+// implementations keep compiling.
+type LevelEnabler interface {
+	Enabled(level int) bool
+}
+
+// Enabled reports whether logger would write a record at level; loggers that
+// do not implement LevelEnabler are assumed to write every level
+func Enabled(logger LoggerInterface, level int) bool {
+	if e, ok := logger.(LevelEnabler); ok {
+		return e.Enabled(level)
+	}
+	return true
+}
+
 // WHO: ContextVector7D
 // WHAT: 7D Context vector representation
 // WHEN: During context handling operations
@@ -154,8 +170,10 @@ func (l *IOLogger) Read(p []byte) (n int, err error) {
 		return 0, io.EOF
 	}
 	n, err = l.reader.Read(p)
-	if n > 0 {
-		l.logger.Info(fmt.Sprintf("[stdin]: received %d bytes: %s", n, string(p[:n])))
+	// Every stdio chunk passes through here; skip formatting the payload
+	// entirely when info logging is off
+	if n > 0 && Enabled(l.logger, LevelInfo) {
+		l.logger.Info("[stdin]: received %d bytes: %s", n, p[:n])
 	}
 	return n, err
 }
@@ -165,7 +183,9 @@ func (l *IOLogger) Write(p []byte) (n int, err error) {
 	if l.writer == nil {
 		return 0, io.ErrClosedPipe
 	}
-	l.logger.Info(fmt.Sprintf("[stdout]: sending %d bytes: %s", len(p), string(p)))
+	if Enabled(l.logger, LevelInfo) {
+		l.logger.Info("[stdout]: sending %d bytes: %s", len(p), p)
+	}
 	return l.writer.Write(p)
 }
 
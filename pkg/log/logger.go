@@ -9,7 +9,14 @@
 package log
 
 import (
+	"bufio"
 	"fmt"
+	"io"
+	"maps"
+	"os"
+	"strconv"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/jubicudis/Tranquility-Neuro-OS/github-mcp-server/pkg/tranquilspeak"
@@ -27,6 +34,8 @@ type Logger struct {
 	context       map[string]string
 	triggerMatrix *tranquilspeak.TriggerMatrix
 	dna           interface{} // Added for WithDNA/identity-aware logging
+	ctxHead       string      // pre-rendered 7D context up to "when:"
+	ctxTail       string      // pre-rendered 7D context after the timestamp
 }
 
 const (
@@ -39,11 +48,37 @@ const (
 
 // NewLogger creates a new 7D-aware logger with helical memory integration
 func NewLogger(triggerMatrix *tranquilspeak.TriggerMatrix) *Logger {
-	return &Logger{
+	l := &Logger{
 		level:   LevelInfo,
 		context: map[string]string{"who": "System", "what": "Log", "where": "TNOS_MCP_Bridge", "why": "SystemMonitoring", "how": "LoggerComponent", "extent": "SystemWide"},
 		triggerMatrix: triggerMatrix,
 	}
+	l.renderContext()
+	return l
+}
+
+// renderContext pre-renders the 7D context so log records only splice in the timestamp.
+// The layout matches fmt's rendering of the per-record context map (keys sorted).
+func (l *Logger) renderContext() {
+	var b strings.Builder
+	b.WriteString("map[extent:")
+	b.WriteString(l.context["extent"])
+	b.WriteString(" how:")
+	b.WriteString(l.context["how"])
+	b.WriteString(" what:")
+	b.WriteString(l.context["what"])
+	b.WriteString(" when:")
+	l.ctxHead = b.String()
+
+	b.Reset()
+	b.WriteString(" where:")
+	b.WriteString(l.context["where"])
+	b.WriteString(" who:")
+	b.WriteString(l.context["who"])
+	b.WriteString(" why:")
+	b.WriteString(l.context["why"])
+	b.WriteString("]")
+	l.ctxTail = b.String()
 }
 
 // NewNopLogger creates a logger that discards all output
@@ -85,7 +120,10 @@ func (l *Logger) WithContext(ctx map[string]string) *Logger {
 	// EXTENT: Logger context configuration
 
 	if ctx != nil {
-		l.context = ctx
+		// Keep a private copy so the pre-rendered context cannot drift if the
+		// caller changes ctx afterwards
+		l.context = maps.Clone(ctx)
+		l.renderContext()
 	}
 	return l
 }
@@ -94,11 +132,25 @@ func (l *Logger) WithContext(ctx map[string]string) *Logger {
 func (l *Logger) WithDNA(dna interface{}) LoggerInterface {
 	newLogger := *l
 	newLogger.dna = dna
+	// The copy gets its own context map: each logger's ctxHead/ctxTail are
+	// rendered from its map, so SetContext on one must not change the other's
+	newLogger.context = maps.Clone(l.context)
 	return &newLogger
 }
 
+// Enabled reports whether records at level pass the logger's minimum level
+func (l *Logger) Enabled(level int) bool {
+	return level >= l.level
+}
+
 // log writes a message at the specified level
 func (l *Logger) log(level int, message string, args ...interface{}) {
+	l.logWithPrefix(level, "", message, args...)
+}
+
+// logWithPrefix writes a message with a tag prefix that is kept out of the format string,
+// so tags containing '%' are never interpreted and the caller's message is never rewritten
+func (l *Logger) logWithPrefix(level int, prefix, message string, args ...interface{}) {
 	// WHO: LogWriter
 	// WHAT: Write log message
 	// WHEN: During logging operation
@@ -107,7 +159,7 @@ func (l *Logger) log(level int, message string, args ...interface{}) {
 	// HOW: Using formatted output with context
 	// EXTENT: All logging activities
 
-	if level < l.level {
+	if !l.Enabled(level) {
 		return
 	}
 
@@ -115,18 +167,120 @@ func (l *Logger) log(level int, message string, args ...interface{}) {
 	if len(args) > 0 {
 		msg = fmt.Sprintf(message, args...)
 	}
-	// Build 7D context
-	ctx7d := map[string]interface{}{
-		"who":    l.context["who"],
-		"what":   l.context["what"],
-		"when":   time.Now().Unix(),
-		"where":  l.context["where"],
-		"why":    l.context["why"],
-		"how":    l.context["how"],
-		"extent": l.context["extent"],
-	}
+	// 7D context is pre-rendered; only the timestamp varies per record, so the
+	// line is appended directly rather than run through a format string
 	// Only print or store log locally, do not emit ATM trigger here
-	fmt.Printf("[%s] %s | %v\n", time.Now().Format(time.RFC3339), msg, ctx7d)
+	now := time.Now()
+	line := make([]byte, 0, len(prefix)+len(msg)+len(l.ctxHead)+len(l.ctxTail)+48)
+	line = append(line, '[')
+	line = now.AppendFormat(line, time.RFC3339)
+	line = append(line, "] "...)
+	line = append(line, prefix...)
+	line = append(line, msg...)
+	line = append(line, " | "...)
+	line = append(line, l.ctxHead...)
+	line = strconv.AppendInt(line, now.Unix(), 10)
+	line = append(line, l.ctxTail...)
+	line = append(line, '\n')
+	enqueueLogLine(line)
+	// Errors are often the last thing a failing process writes, so they reach
+	// stdout before the call returns instead of waiting on the flush timer
+	if level >= LevelError {
+		Flush()
+	}
+}
+
+// sinkRecord is a formatted log line, or a flush request when ack is set
+type sinkRecord struct {
+	line []byte
+	ack  chan struct{}
+}
+
+// logSinkBufferSize bounds queued records; callers block (back-pressure) when it is full
+const logSinkBufferSize = 1024
+
+// logSinkWriterSize is the stdout write buffer; logSinkFlushInterval bounds how long
+// a written record may sit in it before the sink flushes on its own (Error and
+// Critical records are flushed as soon as they are written)
+const (
+	logSinkWriterSize    = 64 * 1024
+	logSinkFlushInterval = 100 * time.Millisecond
+)
+
+var (
+	logSinkOnce sync.Once
+	logSink     chan sinkRecord
+)
+
+// startLogSink starts the single writer goroutine that owns stdout for log output.
+// Records reach stdout up to logSinkFlushInterval after they are logged, so
+// output written straight to os.Stdout (or through the standard log package)
+// can appear ahead of earlier Logger records. Packages that can import log
+// write through Stdout to stay in order; the rest (formularegistry, which log
+// depends on through tranquilspeak) are not ordered against the sink.
+// Exit paths must call Flush, or buffered records are lost.
+func startLogSink() {
+	// WHO: LogSink
+	// WHAT: Background log writer
+	// WHEN: On first log record
+	// WHERE: System Layer 6 (Integration)
+	// WHY: To keep blocking stdout writes off request and bridge goroutines
+	// HOW: Buffered channel drained into a bufio.Writer, flushed on a short timer,
+	//      when the buffer fills, or when Flush is called
+	// EXTENT: All Logger output
+
+	logSink = make(chan sinkRecord, logSinkBufferSize)
+	go func() {
+		w := bufio.NewWriterSize(os.Stdout, logSinkWriterSize)
+		flushTimer := time.NewTimer(logSinkFlushInterval)
+		flushTimer.Stop()
+		pending := false
+		for {
+			select {
+			case rec := <-logSink:
+				if rec.line != nil {
+					w.Write(rec.line)
+					if !pending {
+						pending = true
+						flushTimer.Reset(logSinkFlushInterval)
+					}
+				}
+				if rec.ack != nil {
+					w.Flush()
+					pending = false
+					close(rec.ack)
+				}
+			case <-flushTimer.C:
+				w.Flush()
+				pending = false
+			}
+		}
+	}()
+}
+
+func enqueueLogLine(line []byte) {
+	logSinkOnce.Do(startLogSink)
+	logSink <- sinkRecord{line: line}
+}
+
+// Stdout queues writes on the log sink, keeping direct console output in order
+// with Logger records
+var Stdout io.Writer = sinkWriter{}
+
+type sinkWriter struct{}
+
+func (sinkWriter) Write(p []byte) (int, error) {
+	// The caller may reuse p once Write returns, so the sink gets a copy
+	enqueueLogLine(append([]byte(nil), p...))
+	return len(p), nil
+}
+
+// Flush blocks until every queued log record has been written; call it before process exit
+func Flush() {
+	logSinkOnce.Do(startLogSink)
+	ack := make(chan struct{})
+	logSink <- sinkRecord{ack: ack}
+	<-ack
 }
 
 // Debug logs a debug message
@@ -205,6 +359,7 @@ func (l *Logger) SetContext(dimension, value string) {
 	// EXTENT: Single context dimension
 
 	l.context[dimension] = value
+	l.renderContext()
 }
 
 // GetContext retrieves the context value for a dimension
@@ -224,6 +379,9 @@ func (l *Logger) GetContext(dimension string) string {
 
 // InfoWithIdentity logs an info message with DNA/identity context
 func (l *Logger) InfoWithIdentity(message string, dna interface{}, args ...interface{}) {
+	if LevelInfo < l.level {
+		return
+	}
 	sig := ""
 	if dna != nil {
 		if s, ok := getDNASignature(dna); ok {
@@ -234,12 +392,14 @@ func (l *Logger) InfoWithIdentity(message string, dna interface{}, args ...inter
 			sig = s
 		}
 	}
-	identityMessage := fmt.Sprintf("[DNA:%s] %s", sig, message)
-	l.log(LevelInfo, identityMessage, args...)
+	l.logWithPrefix(LevelInfo, "[DNA:"+sig+"] ", message, args...)
 }
 
 // DebugWithIdentity logs a debug message with DNA/identity context
 func (l *Logger) DebugWithIdentity(message string, dna interface{}, args ...interface{}) {
+	if LevelDebug < l.level {
+		return
+	}
 	sig := ""
 	if dna != nil {
 		if s, ok := getDNASignature(dna); ok {
@@ -250,12 +410,14 @@ func (l *Logger) DebugWithIdentity(message string, dna interface{}, args ...inte
 			sig = s
 		}
 	}
-	identityMessage := fmt.Sprintf("[DNA:%s] %s", sig, message)
-	l.log(LevelDebug, identityMessage, args...)
+	l.logWithPrefix(LevelDebug, "[DNA:"+sig+"] ", message, args...)
 }
 
 // ErrorWithIdentity logs an error message with DNA/identity context
 func (l *Logger) ErrorWithIdentity(message string, dna interface{}, args ...interface{}) {
+	if LevelError < l.level {
+		return
+	}
 	sig := ""
 	if dna != nil {
 		if s, ok := getDNASignature(dna); ok {
@@ -266,12 +428,14 @@ func (l *Logger) ErrorWithIdentity(message string, dna interface{}, args ...inte
 			sig = s
 		}
 	}
-	identityMessage := fmt.Sprintf("[DNA:%s] %s", sig, message)
-	l.log(LevelError, identityMessage, args...)
+	l.logWithPrefix(LevelError, "[DNA:"+sig+"] ", message, args...)
 }
 
 // CriticalWithIdentity logs a critical message with DNA/identity context
 func (l *Logger) CriticalWithIdentity(message string, dna interface{}, args ...interface{}) {
+	if LevelCritical < l.level {
+		return
+	}
 	sig := ""
 	if dna != nil {
 		if s, ok := getDNASignature(dna); ok {
@@ -282,8 +446,7 @@ func (l *Logger) CriticalWithIdentity(message string, dna interface{}, args ...i
 			sig = s
 		}
 	}
-	identityMessage := fmt.Sprintf("[DNA:%s] %s", sig, message)
-	l.log(LevelCritical, identityMessage, args...)
+	l.logWithPrefix(LevelCritical, "[DNA:"+sig+"] ", message, args...)
 }
 
 // getDNASignature attempts to extract a signature from a DNA-like object
@@ -299,8 +462,10 @@ func getDNASignature(dna interface{}) (string, bool) {
 
 // LogWithTEI logs with TEI (Tranquility Engine Identity) awareness
 func (l *Logger) LogWithTEI(level LogLevel, actionName string, message string, args ...interface{}) {
-	teiMessage := fmt.Sprintf("[TEI:%s] %s", actionName, message)
-	l.log(int(level), teiMessage, args...)
+	if int(level) < l.level {
+		return
+	}
+	l.logWithPrefix(int(level), "[TEI:"+actionName+"] ", message, args...)
 }
 
 // Update logger configuration based on mode
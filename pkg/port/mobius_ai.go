@@ -92,50 +92,44 @@ type PortAssignmentDecision struct {
 	Timestamp      int64                  `json:"timestamp"`
 }
 
+// portAssignmentActions are the simulated paths, in the order PortAssignmentEvaluator
+// returns them: action ("assign") first, then inaction ("skip")
+var portAssignmentActions = [...]string{"assign", "skip"}
+
 // PortAssignmentEvaluator simulates Möbius Collapse for both action and inaction
 // Canonical: All formula registry calls must use ExecuteFormulaByName with TranquilSpeak symbol mapping.
 // See: pkg/formularegistry/formula_registry.go, SymbolMapping, and docs/technical/FORMULAS_AND_BLUEPRINTS.md
 func PortAssignmentEvaluator(triggerMatrix *tspeak.TriggerMatrix, portID string, context7d PortAssignmentContext7D) (PortAssignmentDecision, PortAssignmentDecision, error) {
-	// Prepare simulation payloads for both action and inaction
-	evalPayload := func(action string) map[string]interface{} {
-		return map[string]interface{}{
+	registry := formularegistry.GetBridgeFormulaRegistry()
+	// Both simulations belong to one evaluation and share its timestamp
+	now := time.Now().Unix()
+	var decisions [len(portAssignmentActions)]PortAssignmentDecision
+	var errs [len(portAssignmentActions)]error
+	for i, action := range portAssignmentActions {
+		// Canonical: Use ExecuteFormulaByName to ensure TranquilSpeak symbol compliance
+		result, err := registry.ExecuteFormulaByName("mobius.collapse", map[string]interface{}{
 			"port_id": portID,
 			"action": action,
 			"context_7d": context7d,
+		})
+		errs[i] = err
+		// Extract results (canonical fields)
+		decisions[i] = PortAssignmentDecision{
+			PortID:        portID,
+			Action:        action,
+			Entropy:       getFloat(result, "entropy"),
+			CollapseScore: getFloat(result, "collapse_score"),
+			PredictedPerf: getFloat(result, "predicted_performance"),
+			Context7D:     context7d,
+			Reason:        getString(result, "reason"),
+			Timestamp:     now,
 		}
 	}
 
-	registry := formularegistry.GetBridgeFormulaRegistry()
-	// Canonical: Use ExecuteFormulaByName to ensure TranquilSpeak symbol compliance
-	actionResult, errA := registry.ExecuteFormulaByName("mobius.collapse", evalPayload("assign"))
-	inactionResult, errI := registry.ExecuteFormulaByName("mobius.collapse", evalPayload("skip"))
-
-	if errA != nil || errI != nil {
-		return PortAssignmentDecision{}, PortAssignmentDecision{}, fmt.Errorf("mobius.collapse simulation failed: %v, %v", errA, errI)
-	}
-
-	// Extract results (canonical fields)
-	actionDecision := PortAssignmentDecision{
-		PortID:        portID,
-		Action:        "assign",
-		Entropy:       getFloat(actionResult, "entropy"),
-		CollapseScore: getFloat(actionResult, "collapse_score"),
-		PredictedPerf: getFloat(actionResult, "predicted_performance"),
-		Context7D:     context7d,
-		Reason:        getString(actionResult, "reason"),
-		Timestamp:     time.Now().Unix(),
-	}
-	inactionDecision := PortAssignmentDecision{
-		PortID:        portID,
-		Action:        "skip",
-		Entropy:       getFloat(inactionResult, "entropy"),
-		CollapseScore: getFloat(inactionResult, "collapse_score"),
-		PredictedPerf: getFloat(inactionResult, "predicted_performance"),
-		Context7D:     context7d,
-		Reason:        getString(inactionResult, "reason"),
-		Timestamp:     time.Now().Unix(),
+	if errs[0] != nil || errs[1] != nil {
+		return PortAssignmentDecision{}, PortAssignmentDecision{}, fmt.Errorf("mobius.collapse simulation failed: %v, %v", errs[0], errs[1])
 	}
-	return actionDecision, inactionDecision, nil
+	return decisions[0], decisions[1], nil
 }
 
 // PortAssignmentExecutor performs the actual assignment after collapse decision
@@ -197,9 +191,9 @@ func LogPortAssignmentDecision(decision PortAssignmentDecision) {
 			"timestamp": decision.Timestamp,
 			"ai_dna": helicalEngine.DNA,
 		}
-		// Use the exported CreateDNAStrand and pass the 7D context directly
+		// The store operation builds and persists the DNA strand itself; creating
+		// one here as well only hashed and encoded the same decision twice
 		canonical7D := ToContextVector7D(decision.Context7D)
-		helicalEngine.CreateDNAStrand("PortAssignmentDecision", canonical7D, strandData)
 		// Log via ATM trigger (event-driven, DNA-marked)
 		_ = helicalEngine.ProcessMemoryOperation(tspeak.TriggerTypeMemoryStore, map[string]interface{}{
 			"event": "PortAssignmentDecision",
@@ -208,7 +202,7 @@ func LogPortAssignmentDecision(decision PortAssignmentDecision) {
 		})
 	} else {
 		// Fallback: stdout log (should not be primary in production)
-		fmt.Printf("[PORT-AI][%s] Port: %s | Action: %s | Entropy: %.4f | Collapse: %.4f | Perf: %.4f | Reason: %s | 7D: %+v\n",
+		fmt.Fprintf(log.Stdout, "[PORT-AI][%s] Port: %s | Action: %s | Entropy: %.4f | Collapse: %.4f | Perf: %.4f | Reason: %s | 7D: %+v\n",
 			time.Unix(decision.Timestamp, 0).Format(time.RFC3339), decision.PortID, decision.Action, decision.Entropy, decision.CollapseScore, decision.PredictedPerf, decision.Reason, decision.Context7D)
 	}
 }
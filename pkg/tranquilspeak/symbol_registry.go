@@ -7,6 +7,7 @@ package tranquilspeak
 
 import (
 	"bufio"
+	"bytes"
 	"log"
 	"os"
 	"strings"
@@ -23,8 +24,12 @@ type SymbolEntry struct {
 	HieroglyphicSym string
 	RegistrySym string
 	Cluster string // Composite Symbol
+	tag string // "[Cluster] " log prefix, built once at load
 }
 
+// noSymbolTag prefixes log lines for components without a cluster
+const noSymbolTag = "[NO_SYMBOL] "
+
 var (
 	symbolRegistry map[string]SymbolEntry
 	once sync.Once
@@ -42,11 +47,11 @@ func LoadSymbolRegistry(path string) error {
 		}
 		defer f.Close()
 		scanner := bufio.NewScanner(f)
+		var fields [22]string
 		for scanner.Scan() {
 			line := scanner.Text()
 			if !strings.HasPrefix(line, "|") { continue }
-			fields := strings.Split(line, "|")
-			if len(fields) < 22 { continue }
+			if !splitRegistryRow(line, &fields) { continue }
 			component := strings.TrimSpace(fields[1])
 			entry := SymbolEntry{
 				Component:      component,
@@ -89,10 +94,35 @@ func LoadSymbolRegistry(path string) error {
 			teslaEntry.Cluster = "⚡🌀⧖𓂀♦φ∞"
 			symbolRegistry["tesla_aether_mobius_goldbach"] = teslaEntry
 		}
+
+		// Prebuild each component's log prefix so tagging a line is one concatenation
+		for component, entry := range symbolRegistry {
+			entry.tag = noSymbolTag
+			if entry.Cluster != "" {
+				entry.tag = "[" + entry.Cluster + "] "
+			}
+			symbolRegistry[component] = entry
+		}
 	})
 	return err
 }
 
+// splitRegistryRow fills out with the first len(out) '|'-separated fields of line,
+// matching strings.Split for those fields without allocating the full slice.
+// It reports false when the row has fewer fields than out.
+func splitRegistryRow(line string, out *[22]string) bool {
+	rest := line
+	for i := range out {
+		field, tail, found := strings.Cut(rest, "|")
+		out[i] = field
+		if !found {
+			return i == len(out)-1
+		}
+		rest = tail
+	}
+	return true
+}
+
 // GetSymbolCluster returns the composite symbol cluster for a component/file.
 func GetSymbolCluster(component string) string {
 	if entry, ok := symbolRegistry[component]; ok {
@@ -115,10 +145,38 @@ func GetSymbolCluster(component string) string {
 
 // LogWithSymbolCluster logs a message with the TranquilSpeak symbol cluster for the given component.
 func LogWithSymbolCluster(component string, message string) {
-	cluster := GetSymbolCluster(component)
-	if cluster == "" {
-		log.Printf("[NO_SYMBOL] %s", message)
-	} else {
-		log.Printf("[%s] %s", cluster, message)
+	logSymbolLine(log.Default(), component, message)
+}
+
+// logSymbolLine writes one cluster-tagged line to l
+func logSymbolLine(l *log.Logger, component, message string) {
+	tag := noSymbolTag
+	if entry, ok := symbolRegistry[component]; ok {
+		tag = entry.tag
+	}
+	l.Output(2, tag+message)
+}
+
+// symbolLogBatch collects LogWithSymbolCluster lines for one multi-step operation,
+// formatted exactly as the standard logger would, and writes them in a single call
+type symbolLogBatch struct {
+	buf    bytes.Buffer
+	logger *log.Logger
+}
+
+// add formats a cluster-tagged line into the batch
+func (b *symbolLogBatch) add(component, message string) {
+	if b.logger == nil {
+		b.logger = log.New(&b.buf, log.Prefix(), log.Flags())
+	}
+	logSymbolLine(b.logger, component, message)
+}
+
+// flush writes the collected lines to the standard logger's output and empties the batch
+func (b *symbolLogBatch) flush() {
+	if b.buf.Len() == 0 {
+		return
 	}
+	log.Writer().Write(b.buf.Bytes())
+	b.buf.Reset()
 }
@@ -0,0 +1,58 @@
+/*
+ * WHO: SymbolRegistryTester
+ * WHAT: Tests for symbol registry row parsing
+ * WHEN: During test execution
+ * WHERE: System Layer 6 (Integration) / Test Environment
+ * WHY: To keep row scanning equivalent to splitting every field
+ * HOW: Using Go's testing framework against strings.Split
+ * EXTENT: splitRegistryRow
+ */
+
+package tranquilspeak
+
+import (
+	"strings"
+	"testing"
+)
+
+// registryRow joins n distinct fields with '|'
+func registryRow(n int) string {
+	fields := make([]string, n)
+	for i := range fields {
+		fields[i] = "f" + string(rune('a'+i))
+	}
+	return strings.Join(fields, "|")
+}
+
+func TestSplitRegistryRowMatchesSplit(t *testing.T) {
+	rows := []string{
+		registryRow(22),
+		registryRow(25),
+		"|" + registryRow(21),
+		registryRow(22) + "|",
+		strings.Repeat("|", 21),
+		" lead | spaced |" + registryRow(20),
+	}
+	for _, row := range rows {
+		var got [22]string
+		if !splitRegistryRow(row, &got) {
+			t.Errorf("splitRegistryRow(%q) reported a short row", row)
+			continue
+		}
+		want := strings.Split(row, "|")
+		for i := range got {
+			if got[i] != want[i] {
+				t.Errorf("splitRegistryRow(%q) field %d = %q; want %q", row, i, got[i], want[i])
+			}
+		}
+	}
+}
+
+func TestSplitRegistryRowRejectsShortRows(t *testing.T) {
+	for _, row := range []string{"", "no pipes", registryRow(21), strings.Repeat("|", 20)} {
+		var got [22]string
+		if splitRegistryRow(row, &got) {
+			t.Errorf("splitRegistryRow(%q) accepted a row with %d fields", row, strings.Count(row, "|")+1)
+		}
+	}
+}
@@ -12,6 +12,7 @@ package tranquilspeak
 
 import (
 	"crypto/sha256"
+	"encoding/hex"
 	"fmt"
 	"sync"
 	"time"
@@ -134,6 +135,8 @@ type TriggerMatrix struct {
 	activeQuantumHandshakes map[string]*QuantumHandshakeState
 	qhpMutex                sync.RWMutex
 	qhpExpiryWindow         time.Duration // QHP expiry window
+	qhpCleanupTimer         *time.Timer   // armed only while handshakes are active
+	qhpExpiryQueue          []*QuantumHandshakeState // registration order == expiry order (fixed window)
 	
 	// Tesla-Aether-Goldbach Harmonic Integration - ⚡🌀⧖𓂀♦φ∞
 	harmonicFieldCache      map[string]TeslaAetherHarmonicField
@@ -210,9 +213,6 @@ func NewTriggerMatrix() *TriggerMatrix {
 		aiSuppressionThreshold: 5, // configurable
 	}
 	
-	// Start quantum handshake cleanup routine
-	tm.startQuantumHandshakeCleanup()
-	
 	return tm
 }
 
@@ -232,6 +232,13 @@ func (tm *TriggerMatrix) ProcessTrigger(trigger ATMTrigger) error {
 		return fmt.Errorf("ATM trigger validation failed: %w", err)
 	}
 
+	// A trigger with no handler can only fail; reject it before paying for the
+	// harmonic field, signature hashing and handshake registration below
+	handler, exists := tm.triggers[trigger.TriggerType]
+	if !exists {
+		return fmt.Errorf("no handler registered for trigger type: %s", trigger.TriggerType)
+	}
+
 	// QUANTUM HANDSHAKE PROTOCOL - 🔐⚛️🤝♦Q
 	// Step 1: Calculate Tesla-Aether-Goldbach harmonic field for trigger
 	harmonicField := tm.calculateTeslaAetherHarmonics(Context7D{
@@ -247,8 +254,11 @@ func (tm *TriggerMatrix) ProcessTrigger(trigger ATMTrigger) error {
 	// Step 2: Generate quantum signature with harmonic field influence
 	quantumSignature := tm.generateQuantumSignatureWithHarmonics(trigger, harmonicField)
 	
+	// One clock read serves the expiry check and the new handshake's timestamps
+	now := time.Now()
+
 	// Step 3: Check for existing quantum handshake (quantum-level deduplication)
-	if existingHandshake := tm.getActiveQuantumHandshake(quantumSignature); existingHandshake != nil {
+	if existingHandshake := tm.getActiveQuantumHandshake(quantumSignature, now); existingHandshake != nil {
 		LogWithSymbolCluster("quantum_handshake_protocol", 
 			fmt.Sprintf("🔐⚛️🤝 Quantum handshake already active: %s | Tesla: %.2f | Goldbach: %.2f", 
 				quantumSignature, existingHandshake.TeslaFrequency, existingHandshake.GoldbachResonance))
@@ -256,42 +266,45 @@ func (tm *TriggerMatrix) ProcessTrigger(trigger ATMTrigger) error {
 	}
 	
 	// Step 4: Create new quantum handshake with harmonic field data
-	handshake := tm.createQuantumHandshakeWithHarmonics(quantumSignature, trigger, harmonicField)
+	handshake := tm.createQuantumHandshakeWithHarmonics(quantumSignature, trigger, harmonicField, now)
 	
+	// Registration, routing and metadata lines are collected and written in one
+	// call before the handler runs, instead of one log write per step
+	var logs symbolLogBatch
+
 	// Step 5: Register quantum handshake (quantum entanglement lock)
-	if err := tm.registerQuantumHandshake(handshake); err != nil {
+	if err := tm.registerQuantumHandshake(handshake, &logs); err != nil {
 		return fmt.Errorf("failed to register quantum handshake: %w", err)
 	}
 	
 	// Step 6: Process under quantum protection
 	defer tm.completeQuantumHandshake(quantumSignature)
+	defer logs.flush() // runs first on early return, keeping log order
 
 	// Route through appropriate blood cell type
-	if err := tm.routeThroughBlood(trigger); err != nil {
+	if err := tm.routeThroughBlood(trigger, &logs); err != nil {
 		return fmt.Errorf("blood circulation routing failed: %w", err)
 	}
 
 	// Enhanced metadata logging with harmonic field data
-	LogWithSymbolCluster("atm/ai.meta", fmt.Sprintf(
+	logs.add("atm/ai.meta", fmt.Sprintf(
 		"[AI] ATM Trigger: %s | Priority: %d | BloodCell: %s | DNA: %s | 7D: [%s,%s,%d,%s,%s,%s,%s] | Tesla: %.2f | Goldbach: %.2f",
 		trigger.TriggerType, trigger.Priority, trigger.BloodCellType, trigger.DNA_ID,
 		trigger.Who, trigger.What, trigger.When, trigger.Where, trigger.Why, trigger.How, trigger.Extent,
 		harmonicField.TeslaFrequency, harmonicField.GoldbachSolvability,
 	))
 
-	// Execute registered handler
-	if handler, exists := tm.triggers[trigger.TriggerType]; exists {
-		return handler(trigger)
-	}
+	logs.flush()
 
-	return fmt.Errorf("no handler registered for trigger type: %s", trigger.TriggerType)
+	// Execute registered handler
+	return handler(trigger)
 }
 
 // hashTrigger creates a hash of the trigger's 7D context and type for deduplication
 func (tm *TriggerMatrix) hashTrigger(trigger ATMTrigger) string {
-	data := fmt.Sprintf("%s|%s|%d|%s|%s|%s|%s|%s|%s", trigger.Who, trigger.What, trigger.When, trigger.Where, trigger.Why, trigger.How, trigger.Extent, trigger.TriggerType, trigger.TargetSystem)
-	h := sha256.Sum256([]byte(data))
-	return fmt.Sprintf("%x", h[:])
+	data := fmt.Appendf(nil, "%s|%s|%d|%s|%s|%s|%s|%s|%s", trigger.Who, trigger.What, trigger.When, trigger.Where, trigger.Why, trigger.How, trigger.Extent, trigger.TriggerType, trigger.TargetSystem)
+	h := sha256.Sum256(data)
+	return hex.EncodeToString(h[:])
 }
 
 // validate7DContext ensures all 7D context fields are properly populated
@@ -307,7 +320,7 @@ func (tm *TriggerMatrix) validate7DContext(trigger ATMTrigger) error {
 }
 
 // routeThroughBlood simulates routing the trigger through blood circulation
-func (tm *TriggerMatrix) routeThroughBlood(trigger ATMTrigger) error {
+func (tm *TriggerMatrix) routeThroughBlood(trigger ATMTrigger, logs *symbolLogBatch) error {
 	// Determine blood cell type based on trigger
 	switch trigger.TriggerType {
 	case TriggerTypeDataTransport, TriggerTypeContextUpdate, TriggerTypeMemoryStore, TriggerTypeMemoryRetrieve:
@@ -321,7 +334,7 @@ func (tm *TriggerMatrix) routeThroughBlood(trigger ATMTrigger) error {
 	}
 	
 	// Log circulation through TranquilSpeak
-	LogWithSymbolCluster("circulatory/blood.tranquilspeak", 
+	logs.add("circulatory/blood.tranquilspeak", 
 		fmt.Sprintf("ATM trigger %s routed via %s blood cell to %s", 
 			trigger.TriggerType, trigger.BloodCellType, trigger.TargetSystem))
 	
@@ -395,33 +408,27 @@ func GetTriggerPriority(triggerType string) int {
 
 // generateQuantumSignatureWithHarmonics creates quantum signature with harmonic field influence
 func (tm *TriggerMatrix) generateQuantumSignatureWithHarmonics(trigger ATMTrigger, harmonicField TeslaAetherHarmonicField) string {
-	// Create base signature from 7D context
-	baseData := fmt.Sprintf("%s|%s|%d|%s|%s|%s|%s|%s|%s", 
-		trigger.Who, trigger.What, trigger.When, trigger.Where, 
-		trigger.Why, trigger.How, trigger.Extent, trigger.TriggerType, trigger.TargetSystem)
-	
-	// Enhance with harmonic field data for quantum-level uniqueness
-	harmonicData := fmt.Sprintf("%.6f|%.6f|%.6f|%.6f|%s", 
+	// Format "QHP:<7D context>:HARMONICS:<harmonic field>" straight into one
+	// buffer for hashing, without intermediate strings for each part
+	quantumData := fmt.Appendf(nil, "QHP:%s|%s|%d|%s|%s|%s|%s|%s|%s:HARMONICS:%.6f|%.6f|%.6f|%.6f|%s",
+		trigger.Who, trigger.What, trigger.When, trigger.Where,
+		trigger.Why, trigger.How, trigger.Extent, trigger.TriggerType, trigger.TargetSystem,
 		harmonicField.TeslaFrequency, harmonicField.GoldbachSolvability,
 		harmonicField.MobiusInterference, harmonicField.AetherCoherence,
 		harmonicField.HarmonicPattern)
-	
-	// Combine base + harmonic for quantum signature
-	quantumData := fmt.Sprintf("QHP:%s:HARMONICS:%s", baseData, harmonicData)
-	hash := sha256.Sum256([]byte(quantumData))
-	return fmt.Sprintf("%x", hash[:])[:16] // 16 character quantum signature
+	hash := sha256.Sum256(quantumData)
+	return hex.EncodeToString(hash[:8]) // 16 character quantum signature
 }
 
 // getActiveQuantumHandshake checks for existing quantum handshake
-func (tm *TriggerMatrix) getActiveQuantumHandshake(quantumSignature string) *QuantumHandshakeState {
+func (tm *TriggerMatrix) getActiveQuantumHandshake(quantumSignature string, now time.Time) *QuantumHandshakeState {
 	tm.qhpMutex.RLock()
 	defer tm.qhpMutex.RUnlock()
 	
 	if handshake, exists := tm.activeQuantumHandshakes[quantumSignature]; exists {
-		// Check if handshake has expired
-		if time.Now().After(handshake.ExpiryTime) {
-			// Expired handshake, clean it up
-			delete(tm.activeQuantumHandshakes, quantumSignature)
+		// Expired handshakes are removed by the cleanup timer; a map write here
+		// would race under the read lock
+		if now.After(handshake.ExpiryTime) {
 			return nil
 		}
 		return handshake
@@ -430,17 +437,17 @@ func (tm *TriggerMatrix) getActiveQuantumHandshake(quantumSignature string) *Qua
 }
 
 // createQuantumHandshakeWithHarmonics creates quantum handshake with harmonic field data
-func (tm *TriggerMatrix) createQuantumHandshakeWithHarmonics(quantumSignature string, trigger ATMTrigger, harmonicField TeslaAetherHarmonicField) *QuantumHandshakeState {
-	entanglementHash := tm.generateEntanglementHashWithHarmonics(quantumSignature, trigger, harmonicField)
+func (tm *TriggerMatrix) createQuantumHandshakeWithHarmonics(quantumSignature string, trigger ATMTrigger, harmonicField TeslaAetherHarmonicField, now time.Time) *QuantumHandshakeState {
+	entanglementHash := tm.generateEntanglementHashWithHarmonics(quantumSignature, trigger, harmonicField, now)
 	
 	return &QuantumHandshakeState{
 		OperationID:         quantumSignature,
 		QuantumSignature:    quantumSignature,
 		EntanglementHash:    entanglementHash,
-		Timestamp:           time.Now(),
+		Timestamp:           now,
 		Status:              "pending",
 		Metadata:            trigger.Payload,
-		ExpiryTime:          time.Now().Add(tm.qhpExpiryWindow),
+		ExpiryTime:          now.Add(tm.qhpExpiryWindow),
 		
 		// Tesla-Aether-Goldbach Harmonic Field Integration
 		TeslaFrequency:      harmonicField.TeslaFrequency,
@@ -454,14 +461,14 @@ func (tm *TriggerMatrix) createQuantumHandshakeWithHarmonics(quantumSignature st
 }
 
 // generateEntanglementHashWithHarmonics creates quantum entanglement hash with harmonic influence
-func (tm *TriggerMatrix) generateEntanglementHashWithHarmonics(quantumSignature string, trigger ATMTrigger, harmonicField TeslaAetherHarmonicField) string {
+func (tm *TriggerMatrix) generateEntanglementHashWithHarmonics(quantumSignature string, trigger ATMTrigger, harmonicField TeslaAetherHarmonicField, now time.Time) string {
 	// Combine quantum signature with Tesla-Aether-Goldbach harmonics
-	entanglementData := fmt.Sprintf("QHP_ENTANGLEMENT:%s:TESLA:%.6f:GOLDBACH:%.6f:MOBIUS:%.6f:AETHER:%.6f:%d", 
+	entanglementData := fmt.Appendf(nil, "QHP_ENTANGLEMENT:%s:TESLA:%.6f:GOLDBACH:%.6f:MOBIUS:%.6f:AETHER:%.6f:%d", 
 		quantumSignature, harmonicField.TeslaFrequency, harmonicField.GoldbachSolvability,
-		harmonicField.MobiusInterference, harmonicField.AetherCoherence, time.Now().UnixNano())
+		harmonicField.MobiusInterference, harmonicField.AetherCoherence, now.UnixNano())
 	
-	hash := sha256.Sum256([]byte(entanglementData))
-	return fmt.Sprintf("%x", hash[:])[:12] // 12 character entanglement hash
+	hash := sha256.Sum256(entanglementData)
+	return hex.EncodeToString(hash[:6]) // 12 character entanglement hash
 }
 
 // selectQuantumFormula selects appropriate formula from registry based on harmonic field
@@ -479,21 +486,25 @@ func (tm *TriggerMatrix) selectQuantumFormula(harmonicField TeslaAetherHarmonicF
 	return "quantum_handshake_protocol" // default
 }
 
-// registerQuantumHandshake registers new quantum handshake with quantum entanglement lock
-func (tm *TriggerMatrix) registerQuantumHandshake(handshake *QuantumHandshakeState) error {
+// registerQuantumHandshake registers new quantum handshake with quantum entanglement lock;
+// the registration line is added to logs and written after the lock is released
+func (tm *TriggerMatrix) registerQuantumHandshake(handshake *QuantumHandshakeState, logs *symbolLogBatch) error {
 	tm.qhpMutex.Lock()
-	defer tm.qhpMutex.Unlock()
 	
 	// Double-check for duplicates under lock
 	if _, exists := tm.activeQuantumHandshakes[handshake.OperationID]; exists {
+		tm.qhpMutex.Unlock()
 		return fmt.Errorf("quantum handshake already registered: %s", handshake.OperationID)
 	}
 	
 	// Register the handshake with quantum entanglement
 	tm.activeQuantumHandshakes[handshake.OperationID] = handshake
+	tm.qhpExpiryQueue = append(tm.qhpExpiryQueue, handshake)
 	handshake.Status = "active"
+	tm.startQuantumHandshakeCleanup()
+	tm.qhpMutex.Unlock()
 	
-	LogWithSymbolCluster("quantum_handshake_protocol", 
+	logs.add("quantum_handshake_protocol", 
 		fmt.Sprintf("🔐⚛️🤝 Quantum handshake registered: %s | Formula: %s | Tesla: %.2f | Goldbach: %.2f", 
 			handshake.OperationID, handshake.QuantumFormula, handshake.TeslaFrequency, handshake.GoldbachResonance))
 	
@@ -501,42 +512,63 @@ func (tm *TriggerMatrix) registerQuantumHandshake(handshake *QuantumHandshakeSta
 }
 
 // completeQuantumHandshake completes and removes quantum handshake
+// The log line is written after qhpMutex is released, so concurrent triggers
+// never wait on log output to register or look up handshakes
 func (tm *TriggerMatrix) completeQuantumHandshake(quantumSignature string) {
 	tm.qhpMutex.Lock()
-	defer tm.qhpMutex.Unlock()
-	
-	if handshake, exists := tm.activeQuantumHandshakes[quantumSignature]; exists {
+	handshake, exists := tm.activeQuantumHandshakes[quantumSignature]
+	if exists {
 		handshake.Status = "completed"
 		delete(tm.activeQuantumHandshakes, quantumSignature)
-		
+	}
+	tm.qhpMutex.Unlock()
+
+	if exists {
 		LogWithSymbolCluster("quantum_handshake_protocol", 
 			fmt.Sprintf("🔐⚛️🤝 Quantum handshake completed: %s", quantumSignature))
 	}
 }
 
-// cleanupExpiredQuantumHandshakes removes expired quantum handshakes
+// cleanupExpiredQuantumHandshakes removes expired quantum handshakes.
+// Every handshake shares qhpExpiryWindow, so the expiry queue is already sorted by
+// ExpiryTime and only the expired prefix is visited instead of the whole map.
 func (tm *TriggerMatrix) cleanupExpiredQuantumHandshakes() {
+	// Cleanup lines are batched and written once qhpMutex is released
+	var logs symbolLogBatch
+	defer logs.flush()
 	tm.qhpMutex.Lock()
 	defer tm.qhpMutex.Unlock()
 	
 	now := time.Now()
-	for signature, handshake := range tm.activeQuantumHandshakes {
-		if now.After(handshake.ExpiryTime) {
-			delete(tm.activeQuantumHandshakes, signature)
-			LogWithSymbolCluster("quantum_handshake_protocol", 
-				fmt.Sprintf("🔐⚛️🤝 Expired quantum handshake cleaned up: %s", signature))
+	expired := 0
+	for _, handshake := range tm.qhpExpiryQueue {
+		if !now.After(handshake.ExpiryTime) {
+			break
+		}
+		expired++
+		// Completed handshakes were already removed; skip entries re-registered since
+		if tm.activeQuantumHandshakes[handshake.OperationID] != handshake {
+			continue
 		}
+		delete(tm.activeQuantumHandshakes, handshake.OperationID)
+		logs.add("quantum_handshake_protocol", 
+			fmt.Sprintf("🔐⚛️🤝 Expired quantum handshake cleaned up: %s", handshake.OperationID))
+	}
+	clear(tm.qhpExpiryQueue[:expired])
+	tm.qhpExpiryQueue = tm.qhpExpiryQueue[expired:]
+
+	tm.qhpCleanupTimer = nil
+	if len(tm.qhpExpiryQueue) > 0 {
+		tm.startQuantumHandshakeCleanup()
 	}
 }
 
-// startQuantumHandshakeCleanup starts background cleanup of expired quantum handshakes
+// startQuantumHandshakeCleanup arms a one-shot cleanup of expired quantum handshakes.
+// The timer is re-armed only while handshakes remain, so an idle matrix never wakes up.
+// Caller must hold qhpMutex.
 func (tm *TriggerMatrix) startQuantumHandshakeCleanup() {
-	go func() {
-		ticker := time.NewTicker(10 * time.Second) // Clean up every 10 seconds
-		defer ticker.Stop()
-		
-		for range ticker.C {
-			tm.cleanupExpiredQuantumHandshakes()
-		}
-	}()
+	if tm.qhpCleanupTimer != nil {
+		return
+	}
+	tm.qhpCleanupTimer = time.AfterFunc(10*time.Second, tm.cleanupExpiredQuantumHandshakes) // Clean up every 10 seconds while active
 }
@@ -144,6 +144,7 @@ func CreateTranslationHelper() (TranslationHelperFunc, func()) {
 		}, func() {
 			// dump the translationKeyMap to a json file
 			if err := DumpTranslationKeyMap(translationKeyMap); err != nil {
+				logpkg.Flush()
 				log.Fatalf("Could not dump translation key map: %v", err)
 			}
 		}
@@ -159,11 +160,7 @@ func DumpTranslationKeyMap(translationKeyMap map[string]string) error {
 	// HOW: Using JSON serialization
 	// EXTENT: Configuration persistence
 
-	file, err := os.Create("github-mcp-server-config.json")
-	if err != nil {
-		return fmt.Errorf("error creating file: %v", err)
-	}
-	defer func() { _ = file.Close() }()
+	const configPath = "github-mcp-server-config.json"
 
 	// marshal the map to json
 	jsonData, err := json.MarshalIndent(translationKeyMap, "", "  ")
@@ -171,10 +168,31 @@ func DumpTranslationKeyMap(translationKeyMap map[string]string) error {
 		return fmt.Errorf("error marshaling map to JSON: %v", err)
 	}
 
-	// write the json data to the file
+	// write to a temp file in the same directory and rename it into place, so
+	// readers never observe a truncated or half-written config
+	file, err := os.CreateTemp(".", configPath+".*.tmp")
+	if err != nil {
+		return fmt.Errorf("error creating file: %v", err)
+	}
+	tmpPath := file.Name()
 	if _, err := file.Write(jsonData); err != nil {
+		_ = file.Close()
+		_ = os.Remove(tmpPath)
 		return fmt.Errorf("error writing to file: %v", err)
 	}
+	if err := file.Chmod(0644); err != nil {
+		_ = file.Close()
+		_ = os.Remove(tmpPath)
+		return fmt.Errorf("error writing to file: %v", err)
+	}
+	if err := file.Close(); err != nil {
+		_ = os.Remove(tmpPath)
+		return fmt.Errorf("error writing to file: %v", err)
+	}
+	if err := os.Rename(tmpPath, configPath); err != nil {
+		_ = os.Remove(tmpPath)
+		return fmt.Errorf("error replacing %s: %v", configPath, err)
+	}
 
 	return nil
 }